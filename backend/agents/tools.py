@@ -15,7 +15,7 @@ import asyncio
 from pathlib import Path
 
 from ..repository.scanner import RepositoryScanner, RepositoryInfo
-from ..database.connector import DatabaseConnector, SchemaAnalysis, TableInfo, QueryResult
+from ..database.connector import DatabaseConnector, SchemaAnalysis, TableInfo, QueryResult, to_json
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +43,9 @@ class RepositoryTools:
             repo_data = []
             for repo in repositories:
                 repo_dict = asdict(repo)
+                # Replace the column-oriented file index with the nested tree
+                del repo_dict['files']
+                repo_dict['file_structure'] = repo.file_structure
                 # Convert datetime objects to strings
                 repo_dict['last_scanned'] = repo_dict['last_scanned'].isoformat()
                 if repo_dict.get('git_info') and repo_dict['git_info'].get('last_commit_date'):
@@ -115,6 +118,9 @@ class RepositoryTools:
                 })
             
             repo_dict = asdict(repo_info)
+            # Replace the column-oriented file index with the nested tree
+            del repo_dict['files']
+            repo_dict['file_structure'] = repo_info.file_structure
             # Convert datetime objects to strings
             repo_dict['last_scanned'] = repo_dict['last_scanned'].isoformat()
             if repo_dict.get('git_info') and repo_dict['git_info'].get('last_commit_date'):
@@ -337,18 +343,10 @@ class DatabaseTools:
         try:
             schema_analysis = await self.connector.analyze_schema(schema_name, force_refresh)
             
-            # Convert to JSON-serializable format
-            analysis_dict = asdict(schema_analysis)
-            analysis_dict['analysis_date'] = analysis_dict['analysis_date'].isoformat()
-            
-            # Convert table info
-            for table in analysis_dict['tables']:
-                table['last_analyzed'] = table['last_analyzed'].isoformat()
-            
-            return json.dumps({
+            return to_json({
                 "status": "success",
-                "schema_analysis": analysis_dict
-            }, indent=2)
+                "schema_analysis": schema_analysis
+            }, indent=True).decode()
             
         except Exception as e:
             logger.error(f"Error analyzing schema {schema_name}: {e}")
@@ -376,14 +374,10 @@ class DatabaseTools:
                     "error": f"Table '{table_name}' not found in schema '{schema_name}'"
                 })
             
-            # Convert to JSON-serializable format
-            table_dict = asdict(table_info)
-            table_dict['last_analyzed'] = table_dict['last_analyzed'].isoformat()
-            
-            return json.dumps({
+            return to_json({
                 "status": "success",
-                "table_info": table_dict
-            }, indent=2)
+                "table_info": table_info
+            }, indent=True).decode()
             
         except Exception as e:
             logger.error(f"Error getting table info for {schema_name}.{table_name}: {e}")
@@ -435,13 +429,10 @@ class DatabaseTools:
         try:
             result = await self.connector.execute_query(query, parameters)
             
-            # Convert result to JSON-serializable format
-            result_dict = asdict(result)
-            
-            return json.dumps({
+            return to_json({
                 "status": "success",
-                "query_result": result_dict
-            }, indent=2)
+                "query_result": result
+            }, indent=True).decode()
             
         except Exception as e:
             logger.error(f"Error executing query: {e}")
@@ -492,14 +483,11 @@ class DatabaseTools:
         try:
             result = await self.connector.query_executor.get_table_sample(schema_name, table_name, limit)
             
-            # Convert result to JSON-serializable format
-            result_dict = asdict(result)
-            
-            return json.dumps({
+            return to_json({
                 "status": "success",
                 "table": f"{schema_name}.{table_name}",
-                "sample_data": result_dict
-            }, indent=2)
+                "sample_data": result
+            }, indent=True).decode()
             
         except Exception as e:
             logger.error(f"Error getting sample data for {schema_name}.{table_name}: {e}")
@@ -776,14 +764,10 @@ class AgentToolRegistry:
     async def initialize(self):
         """Initialize all tools and connections."""
         try:
-            # Initialize repository scanner
             logger.info("Initializing repository scanner...")
             await self.repository_scanner.scan_repositories()
             
-            # Initialize database connection if configured
-            if self.database_connector:
-                logger.info("Initializing database connection...")
-                await self.database_connector.initialize()
+            # The database pool is created lazily by the first connector call
             
             logger.info("Agent tools initialized successfully")
             
@@ -791,10 +775,10 @@ class AgentToolRegistry:
             logger.error(f"Error initializing agent tools: {e}")
             raise
     
-    def cleanup(self):
+    async def cleanup(self):
         """Cleanup resources."""
         if self.database_connector:
-            self.database_connector.close()
+            await self.database_connector.close()
 
 
 # Example tool configurations for Strands agents
@@ -33,6 +33,11 @@ class Settings(BaseSettings):
     # Application settings
     debug: bool = False
     log_level: str = "INFO"
+    # Optional file that receives the JSON log lines alongside stderr
+    log_file: Optional[str] = None
+    # Tasks, workflow contexts and caches live in process memory, so extra
+    # workers do not share state; raise only with a sticky load balancer
+    workers: int = 1
     
     class Config:
         env_file = ".env"
@@ -10,19 +10,90 @@ import os
 import json
 import logging
 import asyncio
-from typing import Dict, List, Optional, Any, Set, Union
-from dataclasses import dataclass, asdict
-from datetime import datetime, timedelta
+import hashlib
+from typing import Callable, Dict, List, Optional, Any, Set, Union
+from dataclasses import dataclass, asdict, field
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from ..repository.scanner import RepositoryScanner, RepositoryInfo
-from ..database.connector import DatabaseConnector, SchemaAnalysis, TableInfo
+from ..database.connector import (
+    DatabaseConnector,
+    SchemaAnalysis,
+    TableInfo,
+    ColumnInfo,
+    IndexInfo,
+    ForeignKeyInfo,
+)
+from ..utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# Version of the persisted context format. Version 2 stores datetimes as
+# integer epoch microseconds, and timezone-aware ones as [epoch microseconds,
+# UTC offset seconds]; version 1 (no version field) used ISO strings.
+CONTEXT_SCHEMA_VERSION = 2
 
-@dataclass
+
+def _to_epoch_us(value: datetime) -> Union[int, List[int]]:
+    """Convert a datetime to epoch microseconds, paired with its UTC offset when aware."""
+    epoch_us = int(value.timestamp()) * 1_000_000 + value.microsecond
+    offset = value.utcoffset()
+    if offset is None:
+        return epoch_us
+    return [epoch_us, int(offset.total_seconds())]
+
+
+def _from_epoch_us(value: Union[int, List[int]]) -> datetime:
+    """Convert persisted epoch microseconds back to a naive or offset-aware datetime."""
+    if isinstance(value, list):
+        epoch_us, offset_seconds = value
+        tz = timezone(timedelta(seconds=offset_seconds))
+    else:
+        epoch_us, tz = value, None
+    seconds, microseconds = divmod(epoch_us, 1_000_000)
+    return datetime.fromtimestamp(seconds, tz).replace(microsecond=microseconds)
+
+
+def _restore_datetime(value: Union[int, List[int], str]) -> datetime:
+    """Restore a persisted datetime from either wire format."""
+    if isinstance(value, str):
+        return datetime.fromisoformat(value)
+    return _from_epoch_us(value)
+
+
+def _reconstruct_schema_analysis(raw: Dict[str, Any]) -> SchemaAnalysis:
+    """Rebuild a SchemaAnalysis and its table objects from persisted form."""
+    tables = []
+    for table in raw["tables"]:
+        tables.append(TableInfo(
+            name=table["name"],
+            schema=table["schema"],
+            table_type=table["table_type"],
+            columns=[ColumnInfo(**column) for column in table["columns"]],
+            indexes=[IndexInfo(**index) for index in table["indexes"]],
+            foreign_keys=[ForeignKeyInfo(**fk) for fk in table["foreign_keys"]],
+            row_count=table["row_count"],
+            comments=table["comments"],
+            last_analyzed=_restore_datetime(table["last_analyzed"])
+        ))
+    
+    return SchemaAnalysis(
+        schema_name=raw["schema_name"],
+        tables=tables,
+        views=raw["views"],
+        sequences=raw["sequences"],
+        procedures=raw["procedures"],
+        functions=raw["functions"],
+        total_tables=raw["total_tables"],
+        total_columns=raw["total_columns"],
+        analysis_date=_restore_datetime(raw["analysis_date"]),
+        analysis_duration=raw["analysis_duration"]
+    )
+
+
+@dataclass(slots=True)
 class RepositoryContext:
     """Repository context information."""
     selected_repositories: List[str]
@@ -32,18 +103,33 @@ class RepositoryContext:
     task_keywords: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class DatabaseContext:
     """Database context information."""
     selected_schema: str
-    schema_analysis: Optional[SchemaAnalysis]
     relevant_tables: List[str]
     table_relationships: Dict[str, Dict[str, List[str]]]
     last_updated: datetime
     connection_status: bool
+    # Persisted form of the schema analysis, kept until first accessed
+    schema_analysis_raw: Optional[Dict[str, Any]] = None
+    _schema_analysis: Optional[SchemaAnalysis] = field(default=None, init=False, repr=False)
+    
+    @property
+    def schema_analysis(self) -> Optional[SchemaAnalysis]:
+        """Get the schema analysis, reconstructing it on first access."""
+        if self._schema_analysis is None and self.schema_analysis_raw is not None:
+            self._schema_analysis = _reconstruct_schema_analysis(self.schema_analysis_raw)
+            self.schema_analysis_raw = None
+        return self._schema_analysis
+    
+    @schema_analysis.setter
+    def schema_analysis(self, value: Optional[SchemaAnalysis]) -> None:
+        self._schema_analysis = value
+        self.schema_analysis_raw = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskContext:
     """Task-specific context information."""
     task_id: str
@@ -55,7 +141,7 @@ class TaskContext:
     workflow_step: str  # 'questions', 'answers', 'card_generation'
 
 
-@dataclass
+@dataclass(slots=True)
 class WorkflowContext:
     """Complete workflow context combining all context types."""
     task_context: TaskContext
@@ -238,6 +324,11 @@ class ContextManager:
         
         self.relevance_analyzer = ContextRelevanceAnalyzer()
         
+        # Keyword/technology extraction keyed by task description digest, so
+        # repeated tasks skip re-analysis; bounded so a long-running server
+        # doesn't keep every description it has ever seen
+        self._task_analysis_cache = TTLCache(maxsize=512, ttl=timedelta(hours=1), name="task analysis cache")
+        
         # In-memory context storage
         self._active_contexts: Dict[str, WorkflowContext] = {}
         self._current_context_id: Optional[str] = None
@@ -262,17 +353,24 @@ class ContextManager:
         Returns:
             Context ID for the created context
         """
-        # Extract keywords and technologies
-        keywords = self.relevance_analyzer._extract_keywords(task_description)
-        technologies = self.relevance_analyzer._identify_technologies(task_description, keywords)
+        # Extract keywords and technologies (reused for identical descriptions)
+        description_hash = hashlib.sha256(task_description.encode()).hexdigest()
+        cached_analysis = self._task_analysis_cache.get(description_hash)
+        if cached_analysis is None:
+            keywords = self.relevance_analyzer._extract_keywords(task_description)
+            technologies = self.relevance_analyzer._identify_technologies(task_description, keywords)
+            # Cached as tuples so no context can mutate the shared entry
+            cached_analysis = (tuple(keywords), tuple(technologies))
+            self._task_analysis_cache.set(description_hash, cached_analysis)
+        keywords, technologies = cached_analysis
         
         # Create task context
         task_context = TaskContext(
             task_id=task_id,
             task_description=task_description,
             task_type=task_type,
-            technologies=technologies,
-            keywords=keywords,
+            technologies=list(technologies),
+            keywords=list(keywords),
             created_at=datetime.now(),
             workflow_step='questions'
         )
@@ -391,18 +489,17 @@ class ContextManager:
         
         workflow_context = self._active_contexts[context_id]
         
-        # Test database connection
-        connection_status = await self.database_connector.test_connection()
-        if not connection_status:
-            logger.error("Database connection failed")
-            return False
-        
-        # Analyze schema if requested
+        # A successful schema analysis proves the connection works; without
+        # one, a pooled connection is pinged instead of running a query
         schema_analysis = None
         relevant_tables = []
         table_relationships = {}
         
-        if analyze_schema:
+        if not analyze_schema:
+            if not await self.database_connector.ping():
+                logger.error("Database connection failed")
+                return False
+        else:
             try:
                 schema_analysis = await self.database_connector.analyze_schema(schema_name)
                 
@@ -416,17 +513,18 @@ class ContextManager:
                     table_relationships[table_name] = relationships
                     
             except Exception as e:
-                logger.warning(f"Schema analysis failed: {e}")
+                logger.error(f"Schema analysis failed: {e}")
+                return False
         
         # Create database context
         db_context = DatabaseContext(
             selected_schema=schema_name,
-            schema_analysis=schema_analysis,
             relevant_tables=relevant_tables,
             table_relationships=table_relationships,
             last_updated=datetime.now(),
-            connection_status=connection_status
+            connection_status=True
         )
+        db_context.schema_analysis = schema_analysis
         
         # Update workflow context
         workflow_context.database_context = db_context
@@ -518,7 +616,15 @@ class ContextManager:
         if not available_repos:
             return {"error": "No repositories available"}
         
-        # Analyze relevance
+        # Score off the event loop so concurrent analyses can overlap
+        return await asyncio.to_thread(self._score_repository_relevance, workflow_context, available_repos)
+    
+    def _score_repository_relevance(
+        self, 
+        workflow_context: WorkflowContext, 
+        available_repos: List[RepositoryInfo]
+    ) -> Dict[str, Any]:
+        """Score and rank repositories for a context (runs in a worker thread)."""
         task_description = workflow_context.task_context.task_description
         relevance_scores = self.relevance_analyzer.analyze_task_relevance(task_description, available_repos)
         
@@ -660,27 +766,32 @@ class ContextManager:
     def _serialize_context(self, context: WorkflowContext) -> Dict[str, Any]:
         """Serialize context to JSON-compatible format."""
         data = {
+            "schema_version": CONTEXT_SCHEMA_VERSION,
             "context_id": context.context_id,
-            "created_at": context.created_at.isoformat(),
-            "last_accessed": context.last_accessed.isoformat(),
+            "created_at": _to_epoch_us(context.created_at),
+            "last_accessed": _to_epoch_us(context.last_accessed),
             "task_context": asdict(context.task_context)
         }
         
         # Convert datetime fields in task context
-        data["task_context"]["created_at"] = context.task_context.created_at.isoformat()
+        data["task_context"]["created_at"] = _to_epoch_us(context.task_context.created_at)
         
         # Add repository context if available
         if context.repository_context:
             repo_data = asdict(context.repository_context)
-            repo_data["last_updated"] = context.repository_context.last_updated.isoformat()
+            repo_data["last_updated"] = _to_epoch_us(context.repository_context.last_updated)
             
             # Convert repository info to serializable format
             repo_info_data = {}
             for name, repo in context.repository_context.repository_info.items():
                 repo_dict = asdict(repo)
-                repo_dict["last_scanned"] = repo.last_scanned.isoformat()
+                # The column-oriented file index holds an array, which JSON
+                # can't encode; persist the nested tree instead
+                del repo_dict["files"]
+                repo_dict["file_structure"] = repo.file_structure
+                repo_dict["last_scanned"] = _to_epoch_us(repo.last_scanned)
                 if repo.git_info and repo.git_info.last_commit_date:
-                    repo_dict["git_info"]["last_commit_date"] = repo.git_info.last_commit_date.isoformat()
+                    repo_dict["git_info"]["last_commit_date"] = _to_epoch_us(repo.git_info.last_commit_date)
                 repo_info_data[name] = repo_dict
             
             repo_data["repository_info"] = repo_info_data
@@ -688,17 +799,25 @@ class ContextManager:
         
         # Add database context if available
         if context.database_context:
-            db_data = asdict(context.database_context)
-            db_data["last_updated"] = context.database_context.last_updated.isoformat()
+            db_context = context.database_context
+            db_data = {
+                "selected_schema": db_context.selected_schema,
+                "relevant_tables": db_context.relevant_tables,
+                "table_relationships": db_context.table_relationships,
+                "last_updated": _to_epoch_us(db_context.last_updated),
+                "connection_status": db_context.connection_status,
+                # A schema analysis that was never accessed is already in persisted form
+                "schema_analysis": db_context.schema_analysis_raw
+            }
             
             # Handle schema analysis
-            if context.database_context.schema_analysis:
-                schema_dict = asdict(context.database_context.schema_analysis)
-                schema_dict["analysis_date"] = context.database_context.schema_analysis.analysis_date.isoformat()
+            if db_context._schema_analysis is not None:
+                schema_dict = asdict(db_context._schema_analysis)
+                schema_dict["analysis_date"] = _to_epoch_us(db_context._schema_analysis.analysis_date)
                 
                 # Convert table info
                 for table_dict in schema_dict["tables"]:
-                    table_dict["last_analyzed"] = datetime.fromisoformat(table_dict["last_analyzed"]).isoformat()
+                    table_dict["last_analyzed"] = _to_epoch_us(table_dict["last_analyzed"])
                 
                 db_data["schema_analysis"] = schema_dict
             
@@ -708,58 +827,62 @@ class ContextManager:
     
     def _deserialize_context(self, data: Dict[str, Any]) -> WorkflowContext:
         """Deserialize context from JSON format."""
+        # Contexts persisted before schema version 2 carry ISO-8601 strings
+        if data.get("schema_version", 1) >= 2:
+            parse_datetime = _from_epoch_us
+        else:
+            parse_datetime = datetime.fromisoformat
+        
         # Deserialize task context
         task_data = data["task_context"]
-        task_data["created_at"] = datetime.fromisoformat(task_data["created_at"])
+        task_data["created_at"] = parse_datetime(task_data["created_at"])
         task_context = TaskContext(**task_data)
         
-        # Deserialize repository context if available
-        repository_context = None
-        if "repository_context" in data:
-            repo_data = data["repository_context"]
-            repo_data["last_updated"] = datetime.fromisoformat(repo_data["last_updated"])
-            
-            # Deserialize repository info
-            repository_info = {}
-            for name, repo_dict in repo_data["repository_info"].items():
-                repo_dict["last_scanned"] = datetime.fromisoformat(repo_dict["last_scanned"])
-                if repo_dict.get("git_info") and repo_dict["git_info"].get("last_commit_date"):
-                    repo_dict["git_info"]["last_commit_date"] = datetime.fromisoformat(repo_dict["git_info"]["last_commit_date"])
-                
-                # This is simplified - in reality you'd need to properly reconstruct RepositoryInfo objects
-                # For now, we'll skip the full reconstruction
-                repository_info[name] = repo_dict
-            
-            repo_data["repository_info"] = repository_info
-            repository_context = RepositoryContext(**repo_data)
-        
-        # Deserialize database context if available
-        database_context = None
-        if "database_context" in data:
-            db_data = data["database_context"]
-            db_data["last_updated"] = datetime.fromisoformat(db_data["last_updated"])
-            
-            # Handle schema analysis deserialization (simplified)
-            if db_data.get("schema_analysis"):
-                schema_data = db_data["schema_analysis"]
-                schema_data["analysis_date"] = datetime.fromisoformat(schema_data["analysis_date"])
-                # Simplified - would need full SchemaAnalysis reconstruction
-                db_data["schema_analysis"] = schema_data
-            
-            database_context = DatabaseContext(**db_data)
+        # Optional sections are dispatched to specialized straight-line helpers
+        repo_data = data.get("repository_context")
+        db_data = data.get("database_context")
         
         # Create workflow context
         workflow_context = WorkflowContext(
             task_context=task_context,
-            repository_context=repository_context,
-            database_context=database_context,
+            repository_context=self._deserialize_repository_context(repo_data, parse_datetime) if repo_data else None,
+            database_context=self._deserialize_database_context(db_data, parse_datetime) if db_data else None,
             context_id=data["context_id"],
-            created_at=datetime.fromisoformat(data["created_at"]),
-            last_accessed=datetime.fromisoformat(data["last_accessed"])
+            created_at=parse_datetime(data["created_at"]),
+            last_accessed=parse_datetime(data["last_accessed"])
         )
         
         return workflow_context
-
+    
+    @staticmethod
+    def _deserialize_repository_context(repo_data: Dict[str, Any], parse_datetime: Callable[[Any], datetime]) -> RepositoryContext:
+        """Deserialize the repository section of a persisted context."""
+        repo_data["last_updated"] = parse_datetime(repo_data["last_updated"])
+        
+        # Deserialize repository info
+        repository_info = {}
+        for name, repo_dict in repo_data["repository_info"].items():
+            repo_dict["last_scanned"] = parse_datetime(repo_dict["last_scanned"])
+            git_data = repo_dict.get("git_info")
+            if git_data and git_data.get("last_commit_date"):
+                git_data["last_commit_date"] = parse_datetime(git_data["last_commit_date"])
+            
+            # This is simplified - in reality you'd need to properly reconstruct RepositoryInfo objects
+            # For now, we'll skip the full reconstruction
+            repository_info[name] = repo_dict
+        
+        repo_data["repository_info"] = repository_info
+        return RepositoryContext(**repo_data)
+    
+    @staticmethod
+    def _deserialize_database_context(db_data: Dict[str, Any], parse_datetime: Callable[[Any], datetime]) -> DatabaseContext:
+        """Deserialize the database section of a persisted context."""
+        db_data["last_updated"] = parse_datetime(db_data["last_updated"])
+        
+        # The schema analysis is left as its raw dict and only rebuilt when
+        # DatabaseContext.schema_analysis is first accessed
+        db_data["schema_analysis_raw"] = db_data.pop("schema_analysis", None)
+        return DatabaseContext(**db_data)
 
 # Example usage
 async def main():
@@ -780,7 +903,7 @@ async def main():
     
     # Analyze repository relevance
     relevance_analysis = await context_manager.analyze_repository_relevance(context_id)
-    print(f"Repository relevance: {relevance_analysis}")
+    logger.debug("Repository relevance: %s", relevance_analysis)
     
     # Set repository context based on relevance
     top_repos = [match["name"] for match in relevance_analysis["top_matches"][:3]]
@@ -791,7 +914,7 @@ async def main():
     
     # Get context summary
     summary = await context_manager.get_context_summary(context_id)
-    print(f"Context summary: {summary}")
+    logger.debug("Context summary: %s", summary)
 
 
 if __name__ == "__main__":
@@ -3,24 +3,63 @@ Database Connector Module
 
 This module provides Oracle database connectivity and schema analysis capabilities
 for AI agents to understand database structure and relationships.
+
+Requires Python 3.10+ (slotted dataclasses).
 """
 
 import os
+import re
+import sys
+import time
+import functools
 import logging
 import asyncio
-from typing import List, Dict, Optional, Any, Set
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Any, Set, Tuple
+from dataclasses import dataclass, asdict, is_dataclass
 from datetime import datetime, timedelta
 import json
 import hashlib
 from contextlib import asynccontextmanager
-import cx_Oracle
-from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
+import oracledb
+
+from ..utils.cache import TTLCache, single_flight
+
+try:
+    # RE2 guarantees linear-time matching for the query security gate
+    import re2 as query_re
+    RE2_AVAILABLE = True
+except ImportError:
+    query_re = re
+    RE2_AVAILABLE = False
+
+try:
+    # orjson serializes dataclasses and datetimes natively, in C
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Unquoted Oracle identifier (case-insensitive, folded to upper case by the server)
+_IDENTIFIER_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_$#]*$')
+
+# Projects the first column of a result row
+_first_column = itemgetter(0)
+
+# jdbc:oracle:thin:@host:port:sid or jdbc:oracle:thin:@//host:port/service
+_JDBC_URL_RE = re.compile(r'jdbc:oracle:thin:@(?://)?([^:/]+):(\d+)[:/](.+)')
 
-@dataclass
+
+def quote_identifier(name: str) -> str:
+    """Quote a caller-supplied Oracle identifier for safe use in SQL text."""
+    if not _IDENTIFIER_RE.match(name):
+        raise ValueError(f"Invalid Oracle identifier: {name}")
+    return f'"{name.upper()}"'
+
+
+@dataclass(slots=True, frozen=True)
 class ColumnInfo:
     """Information about a database column."""
     name: str
@@ -35,7 +74,7 @@ class ColumnInfo:
     comments: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class IndexInfo:
     """Information about a database index."""
     name: str
@@ -46,7 +85,7 @@ class IndexInfo:
     index_type: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ForeignKeyInfo:
     """Information about a foreign key relationship."""
     name: str
@@ -58,7 +97,7 @@ class ForeignKeyInfo:
     update_rule: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TableInfo:
     """Complete information about a database table."""
     name: str
@@ -72,7 +111,7 @@ class TableInfo:
     last_analyzed: datetime
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SchemaAnalysis:
     """Complete schema analysis results."""
     schema_name: str
@@ -87,16 +126,35 @@ class SchemaAnalysis:
     analysis_duration: float
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class QueryResult:
     """Result of a database query execution."""
     columns: List[str]
-    rows: List[List[Any]]
+    rows: List[Tuple[Any, ...]]
     row_count: int
     execution_time: float
     query_hash: str
 
 
+def _json_default(value: Any) -> Any:
+    """Fallback conversion for values the JSON encoder doesn't handle natively."""
+    if is_dataclass(value):
+        return asdict(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+    # Oracle NUMBER columns can come back as Decimal
+    return str(value)
+
+
+def to_json(obj: Any, indent: bool = False) -> bytes:
+    """Serialize schema/query results (or containers of them) to JSON bytes."""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        return orjson.dumps(obj, default=_json_default, option=option)
+    
+    return json.dumps(obj, default=_json_default, indent=2 if indent else None).encode()
+
+
 class DatabaseSecurity:
     """Security measures for database access."""
     
@@ -137,68 +195,109 @@ class DatabaseSecurity:
         r'.*pin.*',
     ]
     
+    # Each pattern list compiled once into a single alternation; the query
+    # gates use RE2 when available since queries come from agents
+    _ALLOWED_RE = query_re.compile('(?i)' + '|'.join(ALLOWED_PATTERNS))
+    _FORBIDDEN_RE = query_re.compile('(?i)' + '|'.join(FORBIDDEN_PATTERNS))
+    _SENSITIVE_RE = re.compile('|'.join(SENSITIVE_COLUMNS))
+    
+    # Literal keywords behind SENSITIVE_COLUMNS, checked before any regex work
+    _SENSITIVE_KEYWORDS = ('password', 'ssn', 'social', 'credit', 'card', 'token', 'secret', 'key', 'pin')
+    
     @classmethod
     def validate_query(cls, query: str) -> bool:
         """Validate that a query is safe for execution."""
-        import re
-        
-        query_upper = query.upper().strip()
-        
-        # Check if query starts with allowed patterns
-        allowed = any(re.match(pattern, query_upper, re.IGNORECASE) for pattern in cls.ALLOWED_PATTERNS)
-        if not allowed:
-            return False
-        
-        # Check for forbidden patterns
-        forbidden = any(re.search(pattern, query_upper, re.IGNORECASE) for pattern in cls.FORBIDDEN_PATTERNS)
-        if forbidden:
+        return _validate_query_cached(query)
+    
+    @classmethod
+    def _is_sensitive(cls, column_name: str) -> bool:
+        """Check whether a column holds sensitive data."""
+        column_lower = column_name.lower()
+        if not any(keyword in column_lower for keyword in cls._SENSITIVE_KEYWORDS):
             return False
-        
-        return True
+        return cls._SENSITIVE_RE.match(column_lower) is not None
+    
+    @staticmethod
+    def _mask_value(value: Any) -> Any:
+        """Mask a single value from a sensitive column."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            return '*' * min(len(value), 8)
+        return '***'
     
     @classmethod
     def mask_sensitive_data(cls, column_name: str, value: Any) -> Any:
         """Mask sensitive data in query results."""
-        import re
-        
         if value is None:
             return None
         
-        column_lower = column_name.lower()
-        is_sensitive = any(re.match(pattern, column_lower) for pattern in cls.SENSITIVE_COLUMNS)
-        
-        if is_sensitive:
-            if isinstance(value, str):
-                return '*' * min(len(value), 8)
-            else:
-                return '***'
+        if cls._is_sensitive(column_name):
+            return cls._mask_value(value)
         
         return value
 
 
+@functools.lru_cache(maxsize=2048)
+def _validate_query_cached(query: str) -> bool:
+    """Run the query security gate; memoized since it is pure in the query text."""
+    query_upper = query.upper().strip()
+    
+    # Check if query starts with allowed patterns
+    if not DatabaseSecurity._ALLOWED_RE.match(query_upper):
+        return False
+    
+    # Check for forbidden patterns
+    if DatabaseSecurity._FORBIDDEN_RE.search(query_upper):
+        return False
+    
+    return True
+
+
 class ConnectionPool:
-    """Thread-safe Oracle connection pool."""
+    """Asyncio Oracle connection pool backed by python-oracledb."""
     
-    def __init__(self, dsn: str, username: str, password: str, min_connections: int = 1, max_connections: int = 5):
+    def __init__(
+        self, 
+        dsn: str, 
+        username: str, 
+        password: str, 
+        min_connections: int = 4, 
+        max_connections: int = 20,
+        connection_increment: int = 2,
+        call_timeout_ms: int = 30000,
+        statement_cache_size: int = 50,
+        ping_interval: int = 60
+    ):
         self.dsn = dsn
         self.username = username
         self.password = password
         self.min_connections = min_connections
         self.max_connections = max_connections
+        self.connection_increment = connection_increment
+        self.ping_interval = ping_interval
+        self.call_timeout_ms = call_timeout_ms
+        self.statement_cache_size = statement_cache_size
         self._pool = None
-        self._executor = ThreadPoolExecutor(max_workers=max_connections)
     
     def initialize(self):
         """Initialize the connection pool."""
         try:
-            self._pool = cx_Oracle.SessionPool(
+            self._pool = oracledb.create_pool_async(
                 user=self.username,
                 password=self.password,
                 dsn=self.dsn,
                 min=self.min_connections,
                 max=self.max_connections,
-                increment=1,
-                encoding="UTF-8"
+                increment=self.connection_increment,
+                # Callers queue for a free session rather than failing under bursts
+                getmode=oracledb.POOL_GETMODE_WAIT,
+                # Idle sessions are health-checked on acquire instead of by
+                # a pre-flight SELECT before each query
+                ping_interval=self.ping_interval,
+                # Each pooled connection keeps this many parsed statements, so
+                # repeated data-dictionary queries skip the parse round-trip
+                stmtcachesize=self.statement_cache_size
             )
             logger.info(f"Database connection pool initialized with {self.min_connections}-{self.max_connections} connections")
         except Exception as e:
@@ -211,19 +310,19 @@ class ConnectionPool:
         if not self._pool:
             raise RuntimeError("Connection pool not initialized")
         
-        loop = asyncio.get_event_loop()
-        connection = await loop.run_in_executor(self._executor, self._pool.acquire)
+        connection = await self._pool.acquire()
+        # Server round-trips are cancelled by the driver after this many ms
+        connection.call_timeout = self.call_timeout_ms
         
         try:
             yield connection
         finally:
-            await loop.run_in_executor(self._executor, self._pool.release, connection)
+            await self._pool.release(connection)
     
-    def close(self):
+    async def close(self):
         """Close the connection pool."""
         if self._pool:
-            self._pool.close()
-            self._executor.shutdown(wait=True)
+            await self._pool.close()
             logger.info("Database connection pool closed")
 
 
@@ -232,149 +331,205 @@ class SchemaAnalyzer:
     
     def __init__(self, connection_pool: ConnectionPool):
         self.pool = connection_pool
-        self._cache = {}
-        self._cache_ttl = timedelta(hours=1)
+        self._cache = TTLCache(maxsize=64, ttl=timedelta(hours=1), name="schema cache")
+        # Caps concurrent metadata lookups at the pool size
+        self._connection_slots = asyncio.Semaphore(connection_pool.max_connections)
+        self._inflight: Dict[str, asyncio.Task] = {}
     
     async def analyze_schema(self, schema_name: str, force_refresh: bool = False) -> SchemaAnalysis:
         """Perform complete schema analysis."""
         cache_key = f"schema_{schema_name}"
         
         # Check cache
-        if not force_refresh and cache_key in self._cache:
-            cached_result, cached_time = self._cache[cache_key]
-            if datetime.now() - cached_time < self._cache_ttl:
+        if not force_refresh:
+            cached_result = self._cache.get(cache_key)
+            if cached_result is not None:
                 logger.debug(f"Using cached schema analysis for {schema_name}")
                 return cached_result
         
+        # Concurrent first-touch callers share a single analysis
+        return await single_flight(
+            self._inflight, cache_key, lambda: self._analyze_schema(schema_name, cache_key)
+        )
+    
+    def invalidate(self, schema_name: str) -> None:
+        """Drop the cached analysis for a schema."""
+        cache_key = f"schema_{schema_name}"
+        self._cache.discard_where(lambda key: key == cache_key)
+    
+    async def _analyze_schema(self, schema_name: str, cache_key: str) -> SchemaAnalysis:
+        """Run the schema analysis queries and cache the result."""
         logger.info(f"Analyzing schema: {schema_name}")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
-            async with self.pool.get_connection() as conn:
-                # Get all tables
-                tables = await self._get_tables(conn, schema_name)
-                
-                # Analyze each table in parallel
-                table_tasks = []
-                for table_name in tables:
-                    task = self._analyze_table(conn, schema_name, table_name)
-                    table_tasks.append(task)
-                
-                table_infos = await asyncio.gather(*table_tasks, return_exceptions=True)
-                
-                # Filter out exceptions
-                valid_tables = [t for t in table_infos if isinstance(t, TableInfo)]
-                
-                # Get other schema objects
-                views = await self._get_views(conn, schema_name)
-                sequences = await self._get_sequences(conn, schema_name)
-                procedures = await self._get_procedures(conn, schema_name)
-                functions = await self._get_functions(conn, schema_name)
-                
-                # Calculate statistics
-                total_columns = sum(len(table.columns) for table in valid_tables)
-                
-                analysis_duration = (datetime.now() - start_time).total_seconds()
-                
-                result = SchemaAnalysis(
-                    schema_name=schema_name,
-                    tables=valid_tables,
-                    views=views,
-                    sequences=sequences,
-                    procedures=procedures,
-                    functions=functions,
-                    total_tables=len(valid_tables),
-                    total_columns=total_columns,
-                    analysis_date=datetime.now(),
-                    analysis_duration=analysis_duration
-                )
-                
-                # Cache the result
-                self._cache[cache_key] = (result, datetime.now())
-                
-                logger.info(f"Schema analysis completed in {analysis_duration:.2f}s: {len(valid_tables)} tables, {total_columns} columns")
-                return result
+            # Table metadata and other schema objects are fetched concurrently
+            valid_tables, schema_objects = await asyncio.gather(
+                self._get_schema_metadata(schema_name),
+                self._run_lookup(self._get_schema_objects, schema_name)
+            )
+            
+            # Calculate statistics
+            total_columns = sum(len(table.columns) for table in valid_tables)
+            
+            analysis_duration = time.perf_counter() - start_time
+            
+            result = SchemaAnalysis(
+                schema_name=schema_name,
+                tables=valid_tables,
+                views=schema_objects['VIEW'],
+                sequences=schema_objects['SEQUENCE'],
+                procedures=schema_objects['PROCEDURE'],
+                functions=schema_objects['FUNCTION'],
+                total_tables=len(valid_tables),
+                total_columns=total_columns,
+                analysis_date=datetime.now(),
+                analysis_duration=analysis_duration
+            )
+            
+            # Cache the result
+            self._cache.set(cache_key, result)
+            
+            logger.info(f"Schema analysis completed in {analysis_duration:.2f}s: {len(valid_tables)} tables, {total_columns} columns")
+            return result
                 
         except Exception as e:
             logger.error(f"Error analyzing schema {schema_name}: {e}")
             raise
     
-    async def _get_tables(self, connection, schema_name: str) -> List[str]:
-        """Get all table names in the schema."""
+    async def _run_lookup(self, lookup, schema_name: str):
+        """Run one metadata lookup on its own pooled connection and cursor."""
+        async with self._connection_slots:
+            async with self.pool.get_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    return await lookup(cursor, schema_name)
+                finally:
+                    cursor.close()
+    
+    async def _get_schema_metadata(self, schema_name: str) -> List[TableInfo]:
+        """Get complete metadata for all tables in a schema."""
+        # Each lookup is a single schema-wide query grouped by table name, and
+        # each runs on a separate connection so the round-trips overlap
+        row_counts, columns, indexes, foreign_keys, comments = await asyncio.gather(
+            self._run_lookup(self._get_all_row_counts, schema_name),
+            self._run_lookup(self._get_all_columns, schema_name),
+            self._run_lookup(self._get_all_indexes, schema_name),
+            self._run_lookup(self._get_all_foreign_keys, schema_name),
+            self._run_lookup(self._get_all_table_comments, schema_name)
+        )
+        
+        # Tables without optimizer statistics fall back to a count
+        if any(row_count is None for row_count in row_counts.values()):
+            row_counts = await self._run_lookup(
+                lambda cursor, schema: self._fill_missing_row_counts(cursor, schema, row_counts),
+                schema_name
+            )
+        
+        # One user-visible timestamp and one shared schema string for the batch
+        analyzed_at = datetime.now()
+        schema_interned = sys.intern(schema_name)
+        tables = []
+        for table_name, row_count in row_counts.items():
+            tables.append(TableInfo(
+                name=sys.intern(table_name),
+                schema=schema_interned,
+                table_type='TABLE',
+                columns=columns.get(table_name, []),
+                indexes=indexes.get(table_name, []),
+                foreign_keys=foreign_keys.get(table_name, []),
+                row_count=row_count,
+                comments=comments.get(table_name),
+                last_analyzed=analyzed_at
+            ))
+        
+        return tables
+    
+    async def _fill_missing_row_counts(
+        self, 
+        cursor, 
+        schema_name: str, 
+        row_counts: Dict[str, Optional[int]]
+    ) -> Dict[str, Optional[int]]:
+        """Count rows for every table whose statistics row count is missing."""
+        filled = dict(row_counts)
+        for table_name, row_count in row_counts.items():
+            if row_count is None:
+                filled[table_name] = await self._get_table_row_count(cursor, schema_name, table_name)
+        return filled
+    
+    @staticmethod
+    async def _fetch_schema_rows(cursor, query: str, schema_name: str, rowfactory=None) -> List[Any]:
+        """Run a dictionary-view query bound to one schema owner and fetch every row."""
+        await cursor.execute(query, {'schema_name': schema_name.upper()})
+        # The driver resets rowfactory on execute, so it is set per query
+        if rowfactory is not None:
+            cursor.rowfactory = rowfactory
+        return await cursor.fetchall()
+    
+    @staticmethod
+    def _column_row(table_name, name, data_type, nullable, default_value, max_length,
+                    precision, scale, is_primary_key, is_foreign_key, comments) -> Tuple[str, ColumnInfo]:
+        """Row factory pairing a table name with its ColumnInfo."""
+        table_name = sys.intern(table_name)
+        return table_name, ColumnInfo(
+            name=name,
+            data_type=sys.intern(data_type),
+            nullable=nullable == 'Y',
+            default_value=default_value,
+            max_length=max_length,
+            precision=precision,
+            scale=scale,
+            is_primary_key=is_primary_key == 'Y',
+            is_foreign_key=is_foreign_key == 'Y',
+            comments=comments
+        )
+    
+    @staticmethod
+    def _index_row(table_name, index_name, index_type, uniqueness, column_list) -> Tuple[str, IndexInfo]:
+        """Row factory pairing a table name with its IndexInfo."""
+        table_name = sys.intern(table_name)
+        return table_name, IndexInfo(
+            name=index_name,
+            table_name=table_name,
+            columns=[sys.intern(column) for column in column_list.split(',')],
+            is_unique=uniqueness == 'UNIQUE',
+            is_primary=False,  # Will be determined separately
+            index_type=sys.intern(index_type)
+        )
+    
+    @staticmethod
+    def _foreign_key_row(constraint_name, source_table, source_columns, r_constraint_name,
+                         target_table, target_columns, delete_rule) -> Tuple[str, ForeignKeyInfo]:
+        """Row factory pairing a source table name with its ForeignKeyInfo."""
+        source_table = sys.intern(source_table)
+        return source_table, ForeignKeyInfo(
+            name=constraint_name,
+            source_table=source_table,
+            source_columns=[sys.intern(column) for column in source_columns.split(',')],
+            target_table=sys.intern(target_table),
+            target_columns=[sys.intern(column) for column in target_columns.split(',')],
+            delete_rule=delete_rule or 'NO ACTION',
+            update_rule='NO ACTION'  # Oracle doesn't support ON UPDATE
+        )
+    
+    async def _get_all_row_counts(self, cursor, schema_name: str) -> Dict[str, Optional[int]]:
+        """Get all table names in the schema with their statistics row counts."""
         query = """
-        SELECT table_name 
+        SELECT table_name, num_rows 
         FROM all_tables 
         WHERE owner = :schema_name 
         ORDER BY table_name
         """
         
-        loop = asyncio.get_event_loop()
-        cursor = await loop.run_in_executor(None, connection.cursor)
-        
-        try:
-            await loop.run_in_executor(None, cursor.execute, query, {'schema_name': schema_name.upper()})
-            rows = await loop.run_in_executor(None, cursor.fetchall)
-            return [row[0] for row in rows]
-        finally:
-            await loop.run_in_executor(None, cursor.close)
-    
-    async def _analyze_table(self, connection, schema_name: str, table_name: str) -> TableInfo:
-        """Analyze a single table."""
-        loop = asyncio.get_event_loop()
-        
-        # Get table metadata
-        table_info = await loop.run_in_executor(
-            None, 
-            self._get_table_metadata, 
-            connection, 
-            schema_name, 
-            table_name
-        )
-        
-        return table_info
-    
-    def _get_table_metadata(self, connection, schema_name: str, table_name: str) -> TableInfo:
-        """Get complete metadata for a table (runs in thread executor)."""
-        cursor = connection.cursor()
-        
-        try:
-            # Get columns
-            columns = self._get_table_columns(cursor, schema_name, table_name)
-            
-            # Get indexes
-            indexes = self._get_table_indexes(cursor, schema_name, table_name)
-            
-            # Get foreign keys
-            foreign_keys = self._get_table_foreign_keys(cursor, schema_name, table_name)
-            
-            # Get table comments
-            comments = self._get_table_comments(cursor, schema_name, table_name)
-            
-            # Get row count (with timeout)
-            try:
-                row_count = self._get_table_row_count(cursor, schema_name, table_name)
-            except:
-                row_count = None
-            
-            return TableInfo(
-                name=table_name,
-                schema=schema_name,
-                table_type='TABLE',
-                columns=columns,
-                indexes=indexes,
-                foreign_keys=foreign_keys,
-                row_count=row_count,
-                comments=comments,
-                last_analyzed=datetime.now()
-            )
-            
-        finally:
-            cursor.close()
+        # Two-column rows build the name -> value map directly
+        return dict(await self._fetch_schema_rows(cursor, query, schema_name))
     
-    def _get_table_columns(self, cursor, schema_name: str, table_name: str) -> List[ColumnInfo]:
-        """Get column information for a table."""
+    async def _get_all_columns(self, cursor, schema_name: str) -> Dict[str, List[ColumnInfo]]:
+        """Get column information for all tables, grouped by table name."""
         query = """
         SELECT 
+            c.table_name,
             c.column_name,
             c.data_type,
             c.nullable,
@@ -403,69 +558,40 @@ class SchemaAnalyzer:
         LEFT JOIN all_col_comments cc ON c.owner = cc.owner 
             AND c.table_name = cc.table_name 
             AND c.column_name = cc.column_name
-        WHERE c.owner = :schema_name AND c.table_name = :table_name
-        ORDER BY c.column_id
+        WHERE c.owner = :schema_name
+        ORDER BY c.table_name, c.column_id
         """
         
-        cursor.execute(query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
-        
-        columns = []
-        for row in cursor.fetchall():
-            column = ColumnInfo(
-                name=row[0],
-                data_type=row[1],
-                nullable=row[2] == 'Y',
-                default_value=row[3],
-                max_length=row[4],
-                precision=row[5],
-                scale=row[6],
-                is_primary_key=row[7] == 'Y',
-                is_foreign_key=row[8] == 'Y',
-                comments=row[9]
-            )
-            columns.append(column)
+        columns: Dict[str, List[ColumnInfo]] = {}
+        for table_name, column in await self._fetch_schema_rows(cursor, query, schema_name, self._column_row):
+            columns.setdefault(table_name, []).append(column)
         
         return columns
     
-    def _get_table_indexes(self, cursor, schema_name: str, table_name: str) -> List[IndexInfo]:
-        """Get index information for a table."""
+    async def _get_all_indexes(self, cursor, schema_name: str) -> Dict[str, List[IndexInfo]]:
+        """Get index information for all tables, grouped by table name."""
         query = """
         SELECT DISTINCT
+            i.table_name,
             i.index_name,
             i.index_type,
             i.uniqueness,
             LISTAGG(ic.column_name, ',') WITHIN GROUP (ORDER BY ic.column_position) as columns
         FROM all_indexes i
         JOIN all_ind_columns ic ON i.index_name = ic.index_name AND i.owner = ic.index_owner
-        WHERE i.owner = :schema_name AND i.table_name = :table_name
-        GROUP BY i.index_name, i.index_type, i.uniqueness
-        ORDER BY i.index_name
+        WHERE i.owner = :schema_name
+        GROUP BY i.table_name, i.index_name, i.index_type, i.uniqueness
+        ORDER BY i.table_name, i.index_name
         """
         
-        cursor.execute(query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
-        
-        indexes = []
-        for row in cursor.fetchall():
-            index = IndexInfo(
-                name=row[0],
-                table_name=table_name,
-                columns=row[3].split(','),
-                is_unique=row[2] == 'UNIQUE',
-                is_primary=False,  # Will be determined separately
-                index_type=row[1]
-            )
-            indexes.append(index)
+        indexes: Dict[str, List[IndexInfo]] = {}
+        for table_name, index in await self._fetch_schema_rows(cursor, query, schema_name, self._index_row):
+            indexes.setdefault(table_name, []).append(index)
         
         return indexes
     
-    def _get_table_foreign_keys(self, cursor, schema_name: str, table_name: str) -> List[ForeignKeyInfo]:
-        """Get foreign key information for a table."""
+    async def _get_all_foreign_keys(self, cursor, schema_name: str) -> Dict[str, List[ForeignKeyInfo]]:
+        """Get foreign key information for all tables, grouped by table name."""
         query = """
         SELECT 
             c.constraint_name,
@@ -480,231 +606,184 @@ class SchemaAnalyzer:
         JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
         JOIN all_cons_columns rcc ON rc.constraint_name = rcc.constraint_name AND rc.owner = rcc.owner
         WHERE c.constraint_type = 'R' 
-            AND c.owner = :schema_name 
-            AND c.table_name = :table_name
+            AND c.owner = :schema_name
         GROUP BY c.constraint_name, c.table_name, c.r_constraint_name, rc.table_name, c.delete_rule
         """
         
-        cursor.execute(query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
-        
-        foreign_keys = []
-        for row in cursor.fetchall():
-            fk = ForeignKeyInfo(
-                name=row[0],
-                source_table=row[1],
-                source_columns=row[2].split(','),
-                target_table=row[4],
-                target_columns=row[5].split(','),
-                delete_rule=row[6] or 'NO ACTION',
-                update_rule='NO ACTION'  # Oracle doesn't support ON UPDATE
-            )
-            foreign_keys.append(fk)
+        foreign_keys: Dict[str, List[ForeignKeyInfo]] = {}
+        for table_name, fk in await self._fetch_schema_rows(cursor, query, schema_name, self._foreign_key_row):
+            foreign_keys.setdefault(table_name, []).append(fk)
         
         return foreign_keys
     
-    def _get_table_comments(self, cursor, schema_name: str, table_name: str) -> Optional[str]:
-        """Get table comments."""
+    async def _get_all_table_comments(self, cursor, schema_name: str) -> Dict[str, Optional[str]]:
+        """Get table comments for all tables in the schema."""
         query = """
-        SELECT comments 
+        SELECT table_name, comments 
         FROM all_tab_comments 
-        WHERE owner = :schema_name AND table_name = :table_name
+        WHERE owner = :schema_name
         """
         
-        cursor.execute(query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
-        
-        row = cursor.fetchone()
-        return row[0] if row else None
+        # Two-column rows build the name -> value map directly
+        return dict(await self._fetch_schema_rows(cursor, query, schema_name))
     
-    def _get_table_row_count(self, cursor, schema_name: str, table_name: str) -> Optional[int]:
-        """Get approximate row count for a table."""
-        # Use statistics first (faster)
-        query = """
-        SELECT num_rows 
-        FROM all_tables 
-        WHERE owner = :schema_name AND table_name = :table_name AND num_rows IS NOT NULL
-        """
-        
-        cursor.execute(query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
-        
-        row = cursor.fetchone()
-        if row and row[0] is not None:
-            return row[0]
-        
-        # If no statistics, do a quick count (with timeout)
+    async def _get_table_row_count(self, cursor, schema_name: str, table_name: str) -> Optional[int]:
+        """Count rows for a table that has no optimizer statistics."""
         try:
             count_query = f"SELECT COUNT(*) FROM {schema_name}.{table_name}"
-            cursor.execute(count_query)
-            row = cursor.fetchone()
+            await cursor.execute(count_query)
+            row = await cursor.fetchone()
             return row[0] if row else None
         except:
             return None
     
-    async def _get_views(self, connection, schema_name: str) -> List[str]:
-        """Get all view names in the schema."""
-        query = "SELECT view_name FROM all_views WHERE owner = :schema_name ORDER BY view_name"
-        
-        loop = asyncio.get_event_loop()
-        cursor = await loop.run_in_executor(None, connection.cursor)
-        
-        try:
-            await loop.run_in_executor(None, cursor.execute, query, {'schema_name': schema_name.upper()})
-            rows = await loop.run_in_executor(None, cursor.fetchall)
-            return [row[0] for row in rows]
-        finally:
-            await loop.run_in_executor(None, cursor.close)
-    
-    async def _get_sequences(self, connection, schema_name: str) -> List[str]:
-        """Get all sequence names in the schema."""
-        query = "SELECT sequence_name FROM all_sequences WHERE sequence_owner = :schema_name ORDER BY sequence_name"
-        
-        loop = asyncio.get_event_loop()
-        cursor = await loop.run_in_executor(None, connection.cursor)
-        
-        try:
-            await loop.run_in_executor(None, cursor.execute, query, {'schema_name': schema_name.upper()})
-            rows = await loop.run_in_executor(None, cursor.fetchall)
-            return [row[0] for row in rows]
-        finally:
-            await loop.run_in_executor(None, cursor.close)
-    
-    async def _get_procedures(self, connection, schema_name: str) -> List[str]:
-        """Get all procedure names in the schema."""
+    async def _get_schema_objects(self, cursor, schema_name: str) -> Dict[str, List[str]]:
+        """Get view, sequence, procedure and function names in the schema."""
         query = """
-        SELECT object_name 
+        SELECT object_type, object_name 
         FROM all_objects 
-        WHERE owner = :schema_name AND object_type = 'PROCEDURE'
-        ORDER BY object_name
+        WHERE owner = :schema_name 
+            AND object_type IN ('VIEW', 'SEQUENCE', 'PROCEDURE', 'FUNCTION')
+        ORDER BY object_type, object_name
         """
         
-        loop = asyncio.get_event_loop()
-        cursor = await loop.run_in_executor(None, connection.cursor)
-        
-        try:
-            await loop.run_in_executor(None, cursor.execute, query, {'schema_name': schema_name.upper()})
-            rows = await loop.run_in_executor(None, cursor.fetchall)
-            return [row[0] for row in rows]
-        finally:
-            await loop.run_in_executor(None, cursor.close)
-    
-    async def _get_functions(self, connection, schema_name: str) -> List[str]:
-        """Get all function names in the schema."""
-        query = """
-        SELECT object_name 
-        FROM all_objects 
-        WHERE owner = :schema_name AND object_type = 'FUNCTION'
-        ORDER BY object_name
-        """
+        rows = await self._fetch_schema_rows(cursor, query, schema_name)
         
-        loop = asyncio.get_event_loop()
-        cursor = await loop.run_in_executor(None, connection.cursor)
+        # Bucket names by object type
+        schema_objects = {'VIEW': [], 'SEQUENCE': [], 'PROCEDURE': [], 'FUNCTION': []}
+        for object_type, object_name in rows:
+            schema_objects[object_type].append(object_name)
         
-        try:
-            await loop.run_in_executor(None, cursor.execute, query, {'schema_name': schema_name.upper()})
-            rows = await loop.run_in_executor(None, cursor.fetchall)
-            return [row[0] for row in rows]
-        finally:
-            await loop.run_in_executor(None, cursor.close)
+        return schema_objects
 
 
 class QueryExecutor:
     """Executes read-only queries against the database."""
     
+    # Rows fetched per round-trip, and the cap on rows kept from one query
+    FETCH_ARRAY_SIZE = 1000
+    DEFAULT_MAX_ROWS = 100_000
+    
     def __init__(self, connection_pool: ConnectionPool):
         self.pool = connection_pool
-        self._query_cache = {}
-        self._cache_ttl = timedelta(minutes=15)
+        self._query_cache = TTLCache(maxsize=1024, ttl=timedelta(minutes=15), name="query cache")
+        self._inflight: Dict[Any, asyncio.Task] = {}
     
-    async def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> QueryResult:
-        """Execute a read-only query."""
+    async def execute_query(
+        self, 
+        query: str, 
+        parameters: Optional[Dict[str, Any]] = None, 
+        use_cache: bool = True,
+        max_rows: int = DEFAULT_MAX_ROWS
+    ) -> QueryResult:
+        """Execute a read-only query, keeping at most max_rows rows."""
         # Validate query security
         if not DatabaseSecurity.validate_query(query):
             raise ValueError("Query contains forbidden operations")
         
-        # Generate cache key
-        query_hash = hashlib.md5(f"{query}_{parameters}".encode()).hexdigest()
+        # Cache on the query, its parameters and the row cap directly; no
+        # hashing on lookup. A result truncated at one cap must not be served
+        # to a caller asking for more rows.
+        cache_key = (query, tuple(sorted(parameters.items())) if parameters else None, max_rows)
         
         # Check cache
-        if use_cache and query_hash in self._query_cache:
-            cached_result, cached_time = self._query_cache[query_hash]
-            if datetime.now() - cached_time < self._cache_ttl:
-                logger.debug(f"Using cached query result: {query_hash}")
+        if use_cache:
+            cached_result = self._query_cache.get(cache_key)
+            if cached_result is not None:
+                logger.debug(f"Using cached query result: {cached_result.query_hash}")
                 return cached_result
+            
+            # Concurrent callers of the same cacheable query share one execution
+            return await single_flight(
+                self._inflight, 
+                cache_key, 
+                lambda: self._run_query(query, parameters, cache_key, max_rows)
+            )
         
+        return await self._run_query(query, parameters, None, max_rows)
+    
+    async def _run_query(
+        self, 
+        query: str, 
+        parameters: Optional[Dict[str, Any]], 
+        cache_key: Optional[Tuple], 
+        max_rows: int
+    ) -> QueryResult:
+        """Execute a validated query, caching the result when a cache key is given."""
         logger.info(f"Executing query: {query[:100]}...")
-        start_time = datetime.now()
+        start_time = time.perf_counter()
         
         try:
             async with self.pool.get_connection() as conn:
-                loop = asyncio.get_event_loop()
-                cursor = await loop.run_in_executor(None, conn.cursor)
+                cursor = conn.cursor()
                 
                 try:
-                    # Set query timeout (30 seconds)
-                    await loop.run_in_executor(None, self._execute_with_timeout, cursor, query, parameters)
+                    # Amortize network round-trips over large fetches
+                    cursor.arraysize = self.FETCH_ARRAY_SIZE
+                    cursor.prefetchrows = self.FETCH_ARRAY_SIZE + 1
                     
-                    # Fetch results
-                    rows = await loop.run_in_executor(None, cursor.fetchall)
+                    await cursor.execute(query, parameters)
                     
                     # Get column names
                     columns = [desc[0] for desc in cursor.description] if cursor.description else []
                     
-                    # Apply security filtering
+                    # Apply security filtering (sensitivity is decided once per column,
+                    # and result sets without sensitive columns are passed through)
+                    sensitive_idx = [i for i, column in enumerate(columns) if DatabaseSecurity._is_sensitive(column)]
+                    mask_value = DatabaseSecurity._mask_value
+                    
+                    # Fetch results in batches, stopping once max_rows is exceeded
                     filtered_rows = []
-                    for row in rows:
-                        filtered_row = []
-                        for i, value in enumerate(row):
-                            column_name = columns[i] if i < len(columns) else f"col_{i}"
-                            filtered_value = DatabaseSecurity.mask_sensitive_data(column_name, value)
-                            filtered_row.append(filtered_value)
-                        filtered_rows.append(filtered_row)
+                    while True:
+                        rows = await cursor.fetchmany(self.FETCH_ARRAY_SIZE)
+                        if not rows:
+                            break
+                        
+                        # Rows stay tuples as returned by the driver; only rows that
+                        # need masking are copied
+                        if sensitive_idx:
+                            for row in rows:
+                                filtered_row = list(row)
+                                for i in sensitive_idx:
+                                    filtered_row[i] = mask_value(filtered_row[i])
+                                filtered_rows.append(tuple(filtered_row))
+                        else:
+                            filtered_rows.extend(rows)
+                        
+                        if len(filtered_rows) > max_rows:
+                            del filtered_rows[max_rows:]
+                            logger.warning(f"Query result truncated to {max_rows} rows")
+                            break
                     
-                    execution_time = (datetime.now() - start_time).total_seconds()
+                    execution_time = time.perf_counter() - start_time
                     
                     result = QueryResult(
                         columns=columns,
                         rows=filtered_rows,
                         row_count=len(filtered_rows),
                         execution_time=execution_time,
-                        query_hash=query_hash
+                        query_hash=hashlib.blake2b(f"{query}_{parameters}".encode(), digest_size=16).hexdigest()
                     )
                     
                     # Cache the result
-                    if use_cache:
-                        self._query_cache[query_hash] = (result, datetime.now())
+                    if cache_key is not None:
+                        self._query_cache.set(cache_key, result)
                     
                     logger.info(f"Query executed successfully: {len(filtered_rows)} rows in {execution_time:.2f}s")
                     return result
                     
                 finally:
-                    await loop.run_in_executor(None, cursor.close)
+                    cursor.close()
                     
         except Exception as e:
             logger.error(f"Error executing query: {e}")
             raise
     
-    def _execute_with_timeout(self, cursor, query: str, parameters: Optional[Dict[str, Any]]):
-        """Execute query with timeout (runs in thread executor)."""
-        if parameters:
-            cursor.execute(query, parameters)
-        else:
-            cursor.execute(query)
-    
     async def get_table_sample(self, schema_name: str, table_name: str, limit: int = 10) -> QueryResult:
         """Get a sample of data from a table."""
         query = f"""
-        SELECT * FROM (
-            SELECT * FROM {schema_name}.{table_name}
-            ORDER BY ROWNUM
-        ) WHERE ROWNUM <= :limit
+        SELECT * FROM {quote_identifier(schema_name)}.{quote_identifier(table_name)}
+        FETCH FIRST :limit ROWS ONLY
         """
         
         return await self.execute_query(query, {'limit': limit})
@@ -743,39 +822,49 @@ class DatabaseConnector:
         self.schema_analyzer = SchemaAnalyzer(self.pool)
         self.query_executor = QueryExecutor(self.pool)
         
+        # Data-dictionary lookups (relationships, table searches) keyed by
+        # (kind, SCHEMA, ...) so a whole schema can be invalidated at once
+        self._lookup_cache = TTLCache(maxsize=1024, ttl=timedelta(minutes=5), name="lookup cache")
+        self._lookup_inflight: Dict[Tuple, asyncio.Task] = {}
+        
+        # Foreign-key adjacency per SCHEMA as (parents, children), prefetched
+        # alongside schema analysis and expiring with the schema cache
+        self._relationship_graphs = TTLCache(maxsize=64, ttl=timedelta(hours=1), name="relationship graph cache")
+        
         self._initialized = False
+        self._init_lock = asyncio.Lock()
     
     def _parse_dsn(self, jdbc_url: str) -> str:
         """Parse Oracle DSN from JDBC URL."""
         # Example: jdbc:oracle:thin:@localhost:1521:xe
         # or: jdbc:oracle:thin:@//localhost:1521/xe
-        import re
-        
-        pattern = r'jdbc:oracle:thin:@(?://)?([^:/]+):(\d+)[:/](.+)'
-        match = re.match(pattern, jdbc_url)
+        match = _JDBC_URL_RE.match(jdbc_url)
         
         if not match:
             raise ValueError(f"Invalid Oracle JDBC URL: {jdbc_url}")
         
-        host = match.group(1)
-        port = match.group(2)
-        service = match.group(3)
+        host, port, service = match.groups()
+        if not host.strip() or not port.isdigit() or not 0 < int(port) < 65536:
+            raise ValueError(f"Invalid host or port in Oracle JDBC URL: {jdbc_url}")
         
         return f"{host}:{port}/{service}"
     
     async def initialize(self):
-        """Initialize the database connection."""
+        """Initialize the database connection on first use."""
         if self._initialized:
             return
         
-        try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, self.pool.initialize)
-            self._initialized = True
-            logger.info("Database connector initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize database connector: {e}")
-            raise
+        async with self._init_lock:
+            if self._initialized:
+                return
+            
+            try:
+                self.pool.initialize()
+                self._initialized = True
+                logger.info("Database connector initialized successfully")
+            except Exception as e:
+                logger.error(f"Failed to initialize database connector: {e}")
+                raise
     
     async def test_connection(self) -> bool:
         """Test the database connection."""
@@ -787,11 +876,76 @@ class DatabaseConnector:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    async def ping(self) -> bool:
+        """Check connectivity by acquiring a pooled connection and pinging it."""
+        try:
+            await self.initialize()
+            async with self.pool.get_connection() as conn:
+                await conn.ping()
+            return True
+        except Exception as e:
+            logger.error(f"Database ping failed: {e}")
+            return False
+    
     async def analyze_schema(self, schema_name: str, force_refresh: bool = False) -> SchemaAnalysis:
         """Analyze a database schema."""
         await self.initialize()
+        
+        # The relationship graph is loaded once per schema, next to the
+        # analysis; a failed prefetch never fails the analysis itself
+        if force_refresh or self._relationship_graphs.get(schema_name.upper()) is None:
+            schema_analysis, _ = await asyncio.gather(
+                self.schema_analyzer.analyze_schema(schema_name, force_refresh),
+                self._prefetch_relationships(schema_name)
+            )
+            return schema_analysis
+        
         return await self.schema_analyzer.analyze_schema(schema_name, force_refresh)
     
+    async def _prefetch_relationships(self, schema_name: str) -> None:
+        """Load every foreign-key edge touching a schema into parent/child maps.
+        
+        The graph is optional: on failure or truncation nothing is cached and
+        get_table_relationships falls back to per-table queries.
+        """
+        query = """
+        SELECT DISTINCT c.owner, c.table_name as child_table, rc.owner, rc.table_name as parent_table
+        FROM all_constraints c
+        JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
+        WHERE c.constraint_type = 'R' 
+            AND (c.owner = :schema_name OR rc.owner = :schema_name)
+        """
+        
+        schema_key = schema_name.upper()
+        max_edges = QueryExecutor.DEFAULT_MAX_ROWS
+        try:
+            # One row over the cap tells a complete graph from a truncated one
+            result = await self.query_executor.execute_query(
+                query, {'schema_name': schema_key}, use_cache=False, max_rows=max_edges + 1
+            )
+        except Exception as e:
+            logger.warning(f"Foreign-key prefetch failed for schema {schema_name}: {e}")
+            return
+        
+        if result.row_count > max_edges:
+            logger.warning(f"Schema {schema_name} has over {max_edges} foreign-key edges; not caching the graph")
+            return
+        
+        # Rows are distinct per (owner, table) but only names are kept, so
+        # same-named tables in other schemas are deduplicated in first-seen order
+        parent_sets: Dict[str, Dict[str, None]] = {}
+        child_sets: Dict[str, Dict[str, None]] = {}
+        for child_owner, child_table, parent_owner, parent_table in result.rows:
+            if child_owner == schema_key:
+                parent_sets.setdefault(child_table, {})[parent_table] = None
+            if parent_owner == schema_key:
+                child_sets.setdefault(parent_table, {})[child_table] = None
+        
+        parents = {table: list(names) for table, names in parent_sets.items()}
+        children = {table: list(names) for table, names in child_sets.items()}
+        self._relationship_graphs.set(schema_key, (parents, children))
+        logger.debug(f"Prefetched {len(result.rows)} foreign-key edges for schema {schema_name}")
+    
     async def execute_query(self, query: str, parameters: Optional[Dict[str, Any]] = None) -> QueryResult:
         """Execute a read-only query."""
         await self.initialize()
@@ -807,38 +961,88 @@ class DatabaseConnector:
         
         return None
     
+    async def _cached_lookup(self, key: Tuple, fetch):
+        """Serve a data-dictionary lookup from cache, coalescing concurrent misses."""
+        cached = self._lookup_cache.get(key)
+        if cached is not None:
+            return cached
+        
+        async def fetch_and_cache():
+            result = await fetch()
+            self._lookup_cache.set(key, result)
+            return result
+        
+        return await single_flight(self._lookup_inflight, key, fetch_and_cache)
+    
+    def invalidate_schema(self, schema_name: str) -> int:
+        """Drop cached lookups and schema analysis for a schema; returns lookups dropped."""
+        schema_key = schema_name.upper()
+        dropped = self._lookup_cache.discard_where(lambda key: key[1] == schema_key)
+        self._relationship_graphs.discard_where(lambda key: key == schema_key)
+        self.schema_analyzer.invalidate(schema_name)
+        logger.info(f"Invalidated cached metadata for schema {schema_name} ({dropped} lookups)")
+        return dropped
+    
     async def search_tables(self, schema_name: str, pattern: str) -> List[str]:
         """Search for tables matching a pattern."""
+        return await self._cached_lookup(
+            ('search', schema_name.upper(), pattern.upper()),
+            lambda: self._search_tables(schema_name, pattern)
+        )
+    
+    async def _search_tables(self, schema_name: str, pattern: str) -> List[str]:
+        """Query the data dictionary for tables matching a pattern."""
+        await self.initialize()
         query = """
         SELECT table_name 
         FROM all_tables 
         WHERE owner = :schema_name 
-            AND UPPER(table_name) LIKE UPPER(:pattern)
+            AND table_name LIKE :pattern
         ORDER BY table_name
         """
         
-        result = await self.execute_query(query, {
+        # The lookup cache owns caching for these, so the query cache is bypassed
+        result = await self.query_executor.execute_query(query, {
             'schema_name': schema_name.upper(),
-            'pattern': f"%{pattern}%"
-        })
+            # Dictionary names are stored upper case, so fold the pattern
+            # here rather than wrapping the column in UPPER()
+            'pattern': f"%{pattern.upper()}%"
+        }, use_cache=False)
         
-        return [row[0] for row in result.rows]
+        return list(map(_first_column, result.rows))
     
     async def get_table_relationships(self, schema_name: str, table_name: str) -> Dict[str, List[str]]:
         """Get relationships for a table (parents and children)."""
-        # Get parent tables (tables this table references)
-        parent_query = """
-        SELECT DISTINCT rc.table_name as parent_table
+        # Served from the prefetched graph once the schema has been analyzed
+        graph = self._relationship_graphs.get(schema_name.upper())
+        if graph is not None:
+            parents, children = graph
+            table_key = table_name.upper()
+            # Copies, so callers can't modify the shared graph
+            return {
+                'parents': list(parents.get(table_key, ())),
+                'children': list(children.get(table_key, ()))
+            }
+        
+        return await self._cached_lookup(
+            ('relationships', schema_name.upper(), table_name.upper()),
+            lambda: self._get_table_relationships(schema_name, table_name)
+        )
+    
+    async def _get_table_relationships(self, schema_name: str, table_name: str) -> Dict[str, List[str]]:
+        """Query the data dictionary for a table's parents and children."""
+        await self.initialize()
+        # Parent tables (tables this table references) tagged 'P' and child
+        # tables (tables that reference this table) tagged 'C', in one round-trip
+        query = """
+        SELECT DISTINCT 'P' as direction, rc.table_name as related_table
         FROM all_constraints c
         JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
         WHERE c.constraint_type = 'R' 
             AND c.owner = :schema_name 
             AND c.table_name = :table_name
-        """
-        
-        # Get child tables (tables that reference this table)
-        child_query = """
-        SELECT DISTINCT c.table_name as child_table
+        UNION ALL
+        SELECT DISTINCT 'C' as direction, c.table_name as related_table
         FROM all_constraints c
         JOIN all_constraints rc ON c.r_constraint_name = rc.constraint_name AND c.r_owner = rc.owner
         WHERE c.constraint_type = 'R' 
@@ -846,25 +1050,24 @@ class DatabaseConnector:
             AND rc.table_name = :table_name
         """
         
-        parent_result = await self.execute_query(parent_query, {
+        result = await self.query_executor.execute_query(query, {
             'schema_name': schema_name.upper(),
             'table_name': table_name.upper()
-        })
+        }, use_cache=False)
         
-        child_result = await self.execute_query(child_query, {
-            'schema_name': schema_name.upper(),
-            'table_name': table_name.upper()
-        })
+        relationships = {'P': [], 'C': []}
+        for direction, related_table in result.rows:
+            relationships[direction].append(related_table)
         
         return {
-            'parents': [row[0] for row in parent_result.rows],
-            'children': [row[0] for row in child_result.rows]
+            'parents': relationships['P'],
+            'children': relationships['C']
         }
     
-    def close(self):
+    async def close(self):
         """Close the database connection."""
         if self._initialized:
-            self.pool.close()
+            await self.pool.close()
             self._initialized = False
             logger.info("Database connector closed")
 
@@ -893,7 +1096,7 @@ async def main():
         print(f"Query result: {result.rows}")
         
     finally:
-        connector.close()
+        await connector.close()
 
 
 if __name__ == "__main__":
@@ -5,15 +5,19 @@ Multi-Agent Jira Card Creation System - Main Application Entry Point
 import os
 import asyncio
 import logging
+import hashlib
+import functools
 from contextlib import asynccontextmanager
 from pathlib import Path
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse, Response
 from pydantic import BaseModel
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, AsyncIterator
+import orjson
+import msgspec
 
 from .repository.scanner import RepositoryScanner
 from .database.connector import DatabaseConnector
@@ -33,16 +37,17 @@ from .middleware import (
     validate_repository_path,
     validate_context_id,
     validate_task_request,
-    log_performance
+    log_performance,
+    configure_logging
 )
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
 logger = logging.getLogger(__name__)
 
+# Angular build output; index.html is read once and served from memory
+FRONTEND_DIST = Path("frontend/dist")
+_INDEX_FILE = FRONTEND_DIST / "index.html"
+_INDEX_BYTES: Optional[bytes] = _INDEX_FILE.read_bytes() if _INDEX_FILE.is_file() else None
+
 # Global instances
 settings = Settings()
 repository_scanner = None
@@ -52,13 +57,35 @@ agent_registry = None
 agent_orchestrator = None
 task_manager = None
 
+# Pre-encoded /api/health body, rebuilt only when a component comes up
+_HEALTH_BODY = b""
+
+
+def _rebuild_health() -> None:
+    """Re-encode the health response from the current component state."""
+    global _HEALTH_BODY
+    _HEALTH_BODY = orjson.dumps({
+        "status": "healthy",
+        "repository_scanner": repository_scanner is not None,
+        "database_connector": database_connector is not None,
+        "context_manager": context_manager is not None,
+        "agent_orchestrator": agent_orchestrator is not None
+    })
+
+
+_rebuild_health()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan management."""
     global repository_scanner, database_connector, context_manager, agent_registry, agent_orchestrator, task_manager
     
+    # Logging is set up here rather than on import, so importing the app
+    # (e.g. from tests) installs no handlers or listener thread
+    configure_logging(settings.debug, settings.log_level, settings.log_file)
     logger.info("Starting Multi-Agent Jira Card Creation System...")
+    tasks_load = None
     
     try:
         # Validate configuration
@@ -72,25 +99,34 @@ async def lifespan(app: FastAPI):
         # Validate repository path
         validate_repository_path(settings.repository_base_path)
         
+        # Initialize task manager; the tasks file loads while the agents start
+        logger.info("Initializing task manager...")
+        tasks_file_path = os.path.join(os.path.dirname(__file__), "..", "tasks.md")
+        task_manager = TaskManager(tasks_file_path)
+        tasks_load = asyncio.create_task(task_manager.aload_tasks())
+        
         # Initialize repository scanner
         logger.info(f"Initializing repository scanner for: {settings.repository_base_path}")
         repository_scanner = RepositoryScanner(settings.repository_base_path)
+        _rebuild_health()
         
         # Initialize database connector if configured
         if settings.oracle_jdbc_url and settings.oracle_username and settings.oracle_password:
-            logger.info("Initializing database connector...")
+            # The pool is created lazily by the first request that needs it
+            logger.info("Configuring database connector...")
             database_connector = DatabaseConnector(
                 jdbc_url=settings.oracle_jdbc_url,
                 username=settings.oracle_username,
                 password=settings.oracle_password
             )
-            await database_connector.initialize()
+            _rebuild_health()
         else:
             logger.warning("Database configuration not found - running without database support")
         
         # Initialize context manager
         logger.info("Initializing context manager...")
         context_manager = ContextManager(repository_scanner, database_connector)
+        _rebuild_health()
         
         # Initialize agent registry
         logger.info("Initializing agent tools...")
@@ -114,13 +150,10 @@ async def lifespan(app: FastAPI):
             context_manager=context_manager
         )
         await agent_orchestrator.initialize()
+        _rebuild_health()
         
-        # Initialize task manager
-        logger.info("Initializing task manager...")
-        tasks_file_path = os.path.join(os.path.dirname(__file__), "..", "tasks.md")
-        task_manager = TaskManager(tasks_file_path)
-        # Load tasks at startup to validate the file exists
-        await asyncio.get_event_loop().run_in_executor(None, task_manager.load_tasks)
+        # Tasks are loaded at startup to validate the file exists
+        await tasks_load
         
         logger.info("System initialization completed successfully")
         
@@ -128,15 +161,17 @@ async def lifespan(app: FastAPI):
         
     except Exception as e:
         logger.error(f"Failed to initialize system: {e}")
+        if tasks_load and not tasks_load.done():
+            tasks_load.cancel()
         raise
     
     finally:
         # Cleanup
         logger.info("Shutting down system...")
         if agent_registry:
-            agent_registry.cleanup()
+            await agent_registry.cleanup()
         if database_connector:
-            database_connector.close()
+            await database_connector.close()
 
 
 # Create FastAPI app
@@ -152,8 +187,11 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:4200", "http://localhost:8080"],
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    # Only what the Angular client sends, so preflight responses stay small
+    allow_methods=["GET", "POST"],
+    allow_headers=["Content-Type", "Authorization"],
+    # Browsers may reuse a preflight result for a day instead of re-sending OPTIONS
+    max_age=86400,
 )
 
 # Add error handling middleware
@@ -175,29 +213,50 @@ class DatabaseContextRequest(BaseModel):
     schema_name: str
 
 
-class WorkflowStepRequest(BaseModel):
+class WorkflowStepRequest(msgspec.Struct):
+    """Workflow step body, decoded with msgspec on the per-step agent endpoints."""
     context_id: str
     step_data: Dict[str, Any]
     next_step: str
 
 
+def parse_body(model: type):
+    """FastAPI dependency that decodes the JSON request body into a msgspec Struct."""
+    decoder = msgspec.json.Decoder(model)
+    
+    async def _parse(request: Request):
+        try:
+            return decoder.decode(await request.body())
+        except (msgspec.ValidationError, msgspec.DecodeError) as e:
+            raise ValidationError(str(e), "body")
+    
+    return _parse
+
+
+def body_openapi(model: type) -> Dict[str, Any]:
+    """openapi_extra entry documenting a body that parse_body decodes outside FastAPI."""
+    _, components = msgspec.json.schema_components([model], ref_template="#/components/schemas/{name}")
+    return {
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": components[model.__name__]}}
+        }
+    }
+
+
 # API Routes
 @app.get("/")
 async def root():
     """Root endpoint - serve Angular app."""
-    return FileResponse("frontend/dist/index.html")
+    if _INDEX_BYTES is None:
+        raise HTTPException(status_code=404, detail="Frontend build not found")
+    return Response(content=_INDEX_BYTES, media_type="text/html")
 
 
 @app.get("/api/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "repository_scanner": repository_scanner is not None,
-        "database_connector": database_connector is not None,
-        "context_manager": context_manager is not None,
-        "agent_orchestrator": agent_orchestrator is not None
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 @app.get("/api/repositories")
@@ -208,26 +267,30 @@ async def get_repositories():
     
     try:
         repositories = await repository_scanner.scan_repositories()
-        return {
-            "status": "success",
-            "count": len(repositories),
-            "repositories": [
-                {
-                    "name": repo.name,
-                    "path": repo.path,
-                    "primary_language": repo.primary_language,
-                    "languages": repo.languages,
-                    "frameworks": repo.frameworks,
-                    "file_count": repo.file_count,
-                    "size_mb": round(repo.size_bytes / (1024 * 1024), 2),
-                    "last_scanned": repo.last_scanned.isoformat()
-                }
-                for repo in repositories
-            ]
-        }
     except Exception as e:
         logger.error(f"Error getting repositories: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+    
+    async def iter_repositories() -> AsyncIterator[bytes]:
+        # Each repository is encoded and sent as it is reached, so the full
+        # response body is never built in memory
+        yield b'{"status":"success","count":%d,"repositories":[' % len(repositories)
+        for index, repo in enumerate(repositories):
+            if index:
+                yield b','
+            yield orjson.dumps({
+                "name": repo.name,
+                "path": repo.path,
+                "primary_language": repo.primary_language,
+                "languages": repo.languages,
+                "frameworks": repo.frameworks,
+                "file_count": repo.file_count,
+                "size_mb": round(repo.size_bytes / 1048576, 2),
+                "last_scanned": repo.last_scanned
+            })
+        yield b']}'
+    
+    return StreamingResponse(iter_repositories(), media_type="application/json")
 
 
 @app.get("/api/database/test")
@@ -247,6 +310,20 @@ async def test_database_connection():
         return {"status": "error", "message": str(e)}
 
 
+@app.post("/api/database/schemas/{schema_name}/refresh")
+async def refresh_database_schema(schema_name: str):
+    """Drop cached metadata for a schema so the next lookup re-reads the data dictionary."""
+    if not database_connector:
+        raise HTTPException(status_code=400, detail="Database not configured")
+    
+    dropped = database_connector.invalidate_schema(schema_name)
+    return {
+        "status": "success",
+        "message": f"Cached metadata cleared for schema: {schema_name}",
+        "invalidated_lookups": dropped
+    }
+
+
 @app.get("/api/tasks")
 @log_performance
 async def get_all_tasks():
@@ -254,26 +331,36 @@ async def get_all_tasks():
     if not task_manager:
         raise ConfigurationError("Task manager not initialized")
     
-    tasks = task_manager.get_all_tasks()
-    summary = task_manager.get_task_summary()
-    categories = task_manager.get_task_categories()
+    def build_response():
+        tasks = task_manager.get_all_tasks()
+        summary = task_manager.get_task_summary()
+        category_counts = task_manager.get_category_counts()
+        
+        # Column-oriented: one list per field instead of repeating the keys per task
+        ids, descriptions, statuses, context_ids, jira_card_ids = [], [], [], [], []
+        for task in tasks:
+            ids.append(task.id)
+            descriptions.append(task.description)
+            statuses.append(task.status)
+            context_ids.append(task.context_id)
+            jira_card_ids.append(task.jira_card_id)
+        
+        return {
+            "status": "success",
+            "columns": {
+                "ids": ids,
+                "descriptions": descriptions,
+                "statuses": statuses,
+                "context_ids": context_ids,
+                "jira_card_ids": jira_card_ids
+            },
+            "summary": summary,
+            "categories": category_counts,
+            "total_tasks": len(tasks)
+        }
     
-    return {
-        "status": "success",
-        "tasks": [
-            {
-                "id": task.id,
-                "description": task.description,
-                "status": task.status,
-                "context_id": task.context_id,
-                "jira_card_id": task.jira_card_id
-            }
-            for task in tasks
-        ],
-        "summary": summary,
-        "categories": {k: len(v) for k, v in categories.items()},
-        "total_tasks": len(tasks)
-    }
+    body = task_manager.cached_json("tasks", build_response)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/tasks/categories")
@@ -283,24 +370,28 @@ async def get_task_categories():
     if not task_manager:
         raise ConfigurationError("Task manager not initialized")
     
-    categories = task_manager.get_task_categories()
-    
-    return {
-        "status": "success",
-        "categories": {
-            category: [
-                {
-                    "id": task.id,
-                    "description": task.description,
-                    "status": task.status,
-                    "context_id": task.context_id,
-                    "jira_card_id": task.jira_card_id
-                }
-                for task in tasks
-            ]
-            for category, tasks in categories.items()
+    def build_response():
+        categories = task_manager.get_task_categories()
+        
+        return {
+            "status": "success",
+            "categories": {
+                category: [
+                    {
+                        "id": task.id,
+                        "description": task.description,
+                        "status": task.status,
+                        "context_id": task.context_id,
+                        "jira_card_id": task.jira_card_id
+                    }
+                    for task in tasks
+                ]
+                for category, tasks in categories.items()
+            }
         }
-    }
+    
+    body = task_manager.cached_json("categories", build_response)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/tasks/search")
@@ -393,7 +484,7 @@ async def reload_tasks():
     if not task_manager:
         raise ConfigurationError("Task manager not initialized")
     
-    tasks = await asyncio.get_event_loop().run_in_executor(None, task_manager.reload_tasks)
+    tasks = await task_manager.areload_tasks()
     
     return {
         "status": "success",
@@ -484,8 +575,8 @@ async def analyze_repository_relevance(context_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/workflow/questions")
-async def generate_questions(request: WorkflowStepRequest):
+@app.post("/api/workflow/questions", openapi_extra=body_openapi(WorkflowStepRequest))
+async def generate_questions(request: WorkflowStepRequest = Depends(parse_body(WorkflowStepRequest))):
     """Generate questions using Jr Developer agent."""
     if not agent_orchestrator:
         raise HTTPException(status_code=500, detail="Agent orchestrator not initialized")
@@ -502,8 +593,8 @@ async def generate_questions(request: WorkflowStepRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/workflow/answers")
-async def generate_answers(request: WorkflowStepRequest):
+@app.post("/api/workflow/answers", openapi_extra=body_openapi(WorkflowStepRequest))
+async def generate_answers(request: WorkflowStepRequest = Depends(parse_body(WorkflowStepRequest))):
     """Generate answers using Tech Lead agent."""
     if not agent_orchestrator:
         raise HTTPException(status_code=500, detail="Agent orchestrator not initialized")
@@ -520,8 +611,8 @@ async def generate_answers(request: WorkflowStepRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/workflow/card")
-async def generate_jira_card(request: WorkflowStepRequest):
+@app.post("/api/workflow/card", openapi_extra=body_openapi(WorkflowStepRequest))
+async def generate_jira_card(request: WorkflowStepRequest = Depends(parse_body(WorkflowStepRequest))):
     """Generate Jira card using Jira Card agent."""
     if not agent_orchestrator:
         raise HTTPException(status_code=500, detail="Agent orchestrator not initialized")
@@ -538,6 +629,13 @@ async def generate_jira_card(request: WorkflowStepRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@functools.lru_cache(maxsize=4096)
+def _mock_issue_number(context_id: str) -> int:
+    """Stable per-context issue number; unlike hash(), identical across processes."""
+    digest = hashlib.blake2b(context_id.encode(), digest_size=4).digest()
+    return int.from_bytes(digest, "little") % 10000
+
+
 @app.post("/api/jira/create")
 async def create_jira_card(
     context_id: str,
@@ -552,10 +650,11 @@ async def create_jira_card(
     try:
         # This would integrate with Jira API
         # For now, return mock response
+        jira_key = f"PROJ-{_mock_issue_number(context_id)}"
         return {
             "status": "success",
-            "jira_key": f"PROJ-{hash(context_id) % 10000}",
-            "url": f"https://your-jira.atlassian.net/browse/PROJ-{hash(context_id) % 10000}",
+            "jira_key": jira_key,
+            "url": f"https://your-jira.atlassian.net/browse/{jira_key}",
             "message": "Jira card created successfully"
         }
     except Exception as e:
@@ -563,13 +662,9 @@ async def create_jira_card(
         raise HTTPException(status_code=500, detail=str(e))
 
 
-# Serve Angular static files
-@app.on_event("startup")
-async def mount_static_files():
-    """Mount static files for Angular frontend."""
-    frontend_dist = Path("frontend/dist")
-    if frontend_dist.exists():
-        app.mount("/", StaticFiles(directory="frontend/dist", html=True), name="frontend")
+# Serve Angular static files; mounted last so the API routes above take precedence
+if FRONTEND_DIST.exists():
+    app.mount("/", StaticFiles(directory=FRONTEND_DIST, html=True), name="frontend")
 
 
 if __name__ == "__main__":
@@ -579,6 +674,10 @@ if __name__ == "__main__":
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,
+        reload=settings.debug,
+        loop="uvloop",
+        http="httptools",
+        # Reload mode supports a single worker only
+        workers=1 if settings.debug else settings.workers,
         log_level="info"
     )
\ No newline at end of file
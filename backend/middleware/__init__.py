@@ -16,7 +16,8 @@ from .error_handler import (
     validate_context_id,
     validate_task_request,
     safe_external_call,
-    log_performance
+    log_performance,
+    configure_logging
 )
 
 __all__ = [
@@ -33,5 +34,6 @@ __all__ = [
     "validate_context_id",
     "validate_task_request",
     "safe_external_call",
-    "log_performance"
+    "log_performance",
+    "configure_logging"
 ]
\ No newline at end of file
@@ -3,40 +3,201 @@ Error handling middleware for the Multi-Agent Jira Card Creator application.
 Provides comprehensive error handling, logging, and user-friendly error responses.
 """
 
+import os
+import re
+import sys
+import stat
+import time
+import queue
+import atexit
+import asyncio
 import logging
-import traceback
-import uuid
-from datetime import datetime
+import functools
+import threading
+from logging.handlers import QueueHandler, QueueListener, WatchedFileHandler
+from datetime import datetime, timezone
 from typing import Dict, Any, Optional
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
+import orjson
 import structlog
 
 
-# Configure structured logging
-structlog.configure(
-    processors=[
-        structlog.stdlib.filter_by_level,
-        structlog.stdlib.add_logger_name,
-        structlog.stdlib.add_log_level,
-        structlog.stdlib.PositionalArgumentsFormatter(),
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
-        structlog.dev.ConsoleRenderer()
-    ],
-    wrapper_class=structlog.stdlib.BoundLogger,
-    logger_factory=structlog.stdlib.LoggerFactory(),
-    cache_logger_on_first_use=True,
-)
+def configure_dev(level: int = logging.INFO) -> None:
+    """Human-readable console logging through the stdlib bridge."""
+    logging.basicConfig(
+        level=level,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso"),
+            structlog.dev.ConsoleRenderer()
+        ],
+        wrapper_class=structlog.stdlib.BoundLogger,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+
+
+def _dumps_str(obj: Any, **kwargs) -> str:
+    """orjson serializer for JSONRenderer when the output must be str."""
+    return orjson.dumps(obj, **kwargs).decode()
+
+
+def _capture_exc_info(logger: Any, method_name: str, event_dict: Dict[str, Any]) -> Dict[str, Any]:
+    """Pin exc_info=True to the live exception before the record leaves the calling thread."""
+    if event_dict.get("exc_info") is True:
+        event_dict["exc_info"] = sys.exc_info()
+    return event_dict
+
+
+class _PassthroughQueueHandler(QueueHandler):
+    """Enqueue records unformatted so all rendering happens on the listener thread."""
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[QueueListener] = None
+
+
+def _install_queue_logging(level: int, log_file: Optional[str] = None) -> None:
+    """Route all stdlib records through a queue drained by a background listener thread."""
+    global _log_listener
+    if _log_listener is not None:
+        return
+    
+    # The real sinks and the JSON rendering live on the listener thread, so a
+    # log call on the event loop only builds the event dict and enqueues it
+    formatter = structlog.stdlib.ProcessorFormatter(
+        processors=[
+            structlog.stdlib.ProcessorFormatter.remove_processors_meta,
+            # Tracebacks are only formatted here, for records that passed the level filter
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=_dumps_str)
+        ],
+        foreign_pre_chain=[
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.add_logger_name,
+            structlog.processors.TimeStamper(fmt="iso", utc=True)
+        ]
+    )
+    sinks = [logging.StreamHandler(sys.stderr)]
+    
+    # Optional log file, written by the same listener thread
+    if log_file:
+        sinks.append(WatchedFileHandler(log_file, encoding="utf-8"))
+    
+    for sink in sinks:
+        sink.setFormatter(formatter)
+    
+    root = logging.getLogger()
+    root.addHandler(_PassthroughQueueHandler(_log_queue))
+    root.setLevel(level)
+    
+    _log_listener = QueueListener(_log_queue, *sinks, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
+
+def configure_prod(level: int = logging.INFO, log_file: Optional[str] = None) -> None:
+    """JSON lines rendered with orjson on a background logging thread."""
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            _capture_exc_info,
+            structlog.stdlib.ProcessorFormatter.wrap_for_formatter
+        ],
+        # Calls below the level are no-ops that skip the processor chain
+        wrapper_class=structlog.make_filtering_bound_logger(level),
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        cache_logger_on_first_use=True,
+    )
+    _install_queue_logging(level, log_file)
+
+
+def configure_logging(debug: bool, log_level: str = "INFO", log_file: Optional[str] = None) -> None:
+    """Configure logging once at application startup from the application settings."""
+    level = logging.getLevelName(log_level.upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    
+    if debug:
+        configure_dev(level)
+    else:
+        configure_prod(level, log_file)
+
 
 logger = structlog.get_logger()
 
+# UUID matched against the whole context id, in dashed or 32-char hex form
+_UUID_RE = re.compile(
+    r'\A(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}'
+    r'|[0-9a-fA-F]{32})\Z'
+)
+
+# Stdlib view of this module's effective level, for skipping log-argument
+# construction when a call would be filtered anyway
+_level_logger = logging.getLogger(__name__)
+
+
+class _RequestIDPool:
+    """Hands out UUID4 hex ids carved from one bulk os.urandom read."""
+    
+    __slots__ = ('buf', 'pos', 'size')
+    
+    def __init__(self, size: int = 1024):
+        self.size = size
+        self.buf = bytearray()
+        self.pos = 0
+    
+    def next(self) -> str:
+        """Return the next id, refilling the random buffer when exhausted."""
+        if self.pos >= len(self.buf):
+            self.buf = bytearray(os.urandom(16 * self.size))
+            self.pos = 0
+        
+        b = self.buf[self.pos:self.pos + 16]
+        self.pos += 16
+        
+        # RFC 4122 version 4 and variant bits
+        b[6] = (b[6] & 0x0f) | 0x40
+        b[8] = (b[8] & 0x3f) | 0x80
+        # Undashed form, same as uuid.UUID.hex
+        return b.hex()
+
+
+_id_pools = threading.local()
+
+
+def _utc_now_iso() -> str:
+    """Current UTC time as an ISO 8601 string with offset."""
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _new_id() -> str:
+    """Get a fresh request/error id from this thread's pool."""
+    pool = getattr(_id_pools, 'pool', None)
+    if pool is None:
+        pool = _id_pools.pool = _RequestIDPool()
+    return pool.next()
+
 
 class ApplicationError(Exception):
     """Base application error with context and user-friendly messaging."""
     
+    __slots__ = ('message', 'error_code', 'status_code', 'details', 'user_message', '_error_id', '_timestamp')
+    
     def __init__(
         self,
         message: str,
@@ -51,13 +212,41 @@ class ApplicationError(Exception):
         self.status_code = status_code
         self.details = details or {}
         self.user_message = user_message or message
-        self.error_id = str(uuid.uuid4())
-        self.timestamp = datetime.utcnow().isoformat()
+        # Generated on first use, so errors that are caught and discarded skip them
+        self._error_id: Optional[str] = None
+        self._timestamp: Optional[str] = None
+    
+    @property
+    def error_id(self) -> str:
+        """Unique id for this error, generated on first access."""
+        if self._error_id is None:
+            self._error_id = _new_id()
+        return self._error_id
+    
+    @property
+    def timestamp(self) -> str:
+        """ISO timestamp of when this error was first reported."""
+        if self._timestamp is None:
+            self._timestamp = _utc_now_iso()
+        return self._timestamp
+    
+    def to_dict(self, request_id: str) -> Dict[str, Any]:
+        """Client-facing error envelope for this error."""
+        return {
+            "error_id": self.error_id,
+            "error_code": self.error_code,
+            "message": self.user_message,
+            "details": self.details,
+            "timestamp": self.timestamp,
+            "request_id": request_id
+        }
 
 
 class ValidationError(ApplicationError):
     """Validation error for input validation failures."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, field: str = None, value: Any = None):
         super().__init__(
             message=message,
@@ -71,6 +260,8 @@ class ValidationError(ApplicationError):
 class ConfigurationError(ApplicationError):
     """Configuration error for missing or invalid configuration."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, config_key: str = None):
         super().__init__(
             message=message,
@@ -84,6 +275,8 @@ class ConfigurationError(ApplicationError):
 class ExternalServiceError(ApplicationError):
     """Error for external service failures (AWS, Jira, etc.)."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, service: str, operation: str = None):
         super().__init__(
             message=message,
@@ -97,6 +290,8 @@ class ExternalServiceError(ApplicationError):
 class RepositoryError(ApplicationError):
     """Error for repository scanning and analysis failures."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, repository: str = None, operation: str = None):
         super().__init__(
             message=message,
@@ -110,6 +305,8 @@ class RepositoryError(ApplicationError):
 class DatabaseError(ApplicationError):
     """Error for database connection and query failures."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, operation: str = None):
         super().__init__(
             message=message,
@@ -123,6 +320,8 @@ class DatabaseError(ApplicationError):
 class AgentError(ApplicationError):
     """Error for AI agent processing failures."""
     
+    __slots__ = ()
+    
     def __init__(self, message: str, agent_type: str = None, step: str = None):
         super().__init__(
             message=message,
@@ -140,27 +339,35 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
         """Handle all requests with comprehensive error catching."""
         
         # Generate request ID for tracking
-        request_id = str(uuid.uuid4())
+        request_id = _new_id()
         request.state.request_id = request_id
         
+        # Every record logged while handling this request, including from the
+        # route itself, picks the id up through merge_contextvars
+        structlog.contextvars.bind_contextvars(request_id=request_id)
+        
+        info_enabled = _level_logger.isEnabledFor(logging.INFO)
+        
         # Log request start
-        logger.info(
-            "Request started",
-            request_id=request_id,
-            method=request.method,
-            path=request.url.path,
-            client=request.client.host if request.client else "unknown"
-        )
+        if info_enabled:
+            # request.client builds a new Address on each access
+            client = request.client
+            logger.info(
+                "Request started",
+                method=request.method,
+                path=request.url.path,
+                client=client.host if client else "unknown"
+            )
         
         try:
             response = await call_next(request)
             
             # Log successful response
-            logger.info(
-                "Request completed",
-                request_id=request_id,
-                status_code=response.status_code
-            )
+            if info_enabled:
+                logger.info(
+                    "Request completed",
+                    status_code=response.status_code
+                )
             
             return response
             
@@ -168,7 +375,6 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             # Handle known application errors
             logger.error(
                 "Application error",
-                request_id=request_id,
                 error_id=e.error_id,
                 error_code=e.error_code,
                 message=e.message,
@@ -176,33 +382,23 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                 status_code=e.status_code
             )
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=e.status_code,
-                content={
-                    "error": {
-                        "error_id": e.error_id,
-                        "error_code": e.error_code,
-                        "message": e.user_message,
-                        "details": e.details,
-                        "timestamp": e.timestamp,
-                        "request_id": request_id
-                    }
-                }
+                content={"error": e.to_dict(request_id)}
             )
             
         except HTTPException as e:
             # Handle FastAPI HTTP exceptions
-            error_id = str(uuid.uuid4())
+            error_id = _new_id()
             
             logger.warning(
                 "HTTP exception",
-                request_id=request_id,
                 error_id=error_id,
                 status_code=e.status_code,
                 detail=e.detail
             )
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=e.status_code,
                 content={
                     "error": {
@@ -210,7 +406,7 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                         "error_code": "HTTP_ERROR",
                         "message": str(e.detail),
                         "details": {},
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": _utc_now_iso(),
                         "request_id": request_id
                     }
                 }
@@ -218,21 +414,20 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             # Handle unexpected errors
-            error_id = str(uuid.uuid4())
+            error_id = _new_id()
             
             logger.error(
                 "Unexpected error",
-                request_id=request_id,
                 error_id=error_id,
                 error_type=type(e).__name__,
                 message=str(e),
-                traceback=traceback.format_exc()
+                exc_info=True
             )
             
             # Don't expose internal errors to users in production
             user_message = "An unexpected error occurred. Please try again or contact support."
             
-            return JSONResponse(
+            return ORJSONResponse(
                 status_code=500,
                 content={
                     "error": {
@@ -240,11 +435,14 @@ class ErrorHandlerMiddleware(BaseHTTPMiddleware):
                         "error_code": "INTERNAL_ERROR",
                         "message": user_message,
                         "details": {"error_type": type(e).__name__},
-                        "timestamp": datetime.utcnow().isoformat(),
+                        "timestamp": _utc_now_iso(),
                         "request_id": request_id
                     }
                 }
             )
+        
+        finally:
+            structlog.contextvars.unbind_contextvars("request_id")
 
 
 def validate_required_config(config: Dict[str, Any], required_keys: list) -> None:
@@ -275,19 +473,26 @@ def validate_required_config(config: Dict[str, Any], required_keys: list) -> Non
 def validate_repository_path(path: str) -> None:
     """Validate repository path exists and is accessible."""
     
-    import os
-    
     if not path:
         raise ValidationError("Repository path cannot be empty", "repositories_path")
     
-    if not os.path.exists(path):
+    # One stat answers both "exists" and "is a directory"
+    try:
+        st = os.stat(path)
+    except (FileNotFoundError, NotADirectoryError):
         raise RepositoryError(
             f"Repository path does not exist: {path}",
             repository=path,
             operation="path_validation"
         )
+    except PermissionError:
+        raise RepositoryError(
+            f"Repository path is not readable: {path}",
+            repository=path,
+            operation="path_validation"
+        )
     
-    if not os.path.isdir(path):
+    if not stat.S_ISDIR(st.st_mode):
         raise RepositoryError(
             f"Repository path is not a directory: {path}",
             repository=path,
@@ -312,48 +517,51 @@ def validate_context_id(context_id: str) -> None:
         raise ValidationError("Context ID must be a string", "context_id", context_id)
     
     # Basic UUID format validation
-    import re
-    uuid_pattern = r'^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$'
-    if not re.match(uuid_pattern, context_id):
+    if not _UUID_RE.match(context_id):
         raise ValidationError("Context ID must be a valid UUID", "context_id", context_id)
 
 
+_REQUIRED_TASK_FIELDS = ("task_id", "description", "task_type")
+_VALID_TASK_TYPES = frozenset({"feature", "bug", "technical", "infrastructure"})
+_VALID_TASK_TYPES_MSG = "feature, bug, technical, infrastructure"
+_TASK_ID_MIN, _TASK_ID_MAX = 3, 50
+_DESCRIPTION_MIN, _DESCRIPTION_MAX = 10, 5000
+
+
 def validate_task_request(task_data: Dict[str, Any]) -> None:
     """Validate task creation request data."""
     
-    required_fields = ["task_id", "description", "task_type"]
-    
-    for field in required_fields:
+    for field in _REQUIRED_TASK_FIELDS:
         if field not in task_data:
             raise ValidationError(f"Required field missing: {field}", field)
         
-        if not task_data[field] or not str(task_data[field]).strip():
+        value = task_data[field]
+        if not value or not str(value).strip():
             raise ValidationError(f"Required field cannot be empty: {field}", field)
     
     # Validate task_type
-    valid_task_types = ["feature", "bug", "technical", "infrastructure"]
-    if task_data["task_type"] not in valid_task_types:
+    task_type = task_data["task_type"]
+    if task_type not in _VALID_TASK_TYPES:
         raise ValidationError(
-            f"Invalid task type. Must be one of: {', '.join(valid_task_types)}",
+            f"Invalid task type. Must be one of: {_VALID_TASK_TYPES_MSG}",
             "task_type",
-            task_data["task_type"]
+            task_type
         )
     
     # Validate task_id format
     task_id = task_data["task_id"].strip()
-    if len(task_id) < 3:
-        raise ValidationError("Task ID must be at least 3 characters long", "task_id", task_id)
-    
-    if len(task_id) > 50:
-        raise ValidationError("Task ID must be no more than 50 characters long", "task_id", task_id)
+    task_id_len = len(task_id)
+    if not _TASK_ID_MIN <= task_id_len <= _TASK_ID_MAX:
+        if task_id_len < _TASK_ID_MIN:
+            raise ValidationError(f"Task ID must be at least {_TASK_ID_MIN} characters long", "task_id", task_id)
+        raise ValidationError(f"Task ID must be no more than {_TASK_ID_MAX} characters long", "task_id", task_id)
     
     # Validate description length
-    description = task_data["description"].strip()
-    if len(description) < 10:
-        raise ValidationError("Task description must be at least 10 characters long", "description")
-    
-    if len(description) > 5000:
-        raise ValidationError("Task description must be no more than 5000 characters long", "description")
+    description_len = len(task_data["description"].strip())
+    if not _DESCRIPTION_MIN <= description_len <= _DESCRIPTION_MAX:
+        if description_len < _DESCRIPTION_MIN:
+            raise ValidationError(f"Task description must be at least {_DESCRIPTION_MIN} characters long", "description")
+        raise ValidationError(f"Task description must be no more than {_DESCRIPTION_MAX} characters long", "description")
 
 
 def safe_external_call(func, *args, service_name: str, operation: str = None, **kwargs):
@@ -367,7 +575,7 @@ def safe_external_call(func, *args, service_name: str, operation: str = None, **
             service=service_name,
             operation=operation,
             error=str(e),
-            traceback=traceback.format_exc()
+            exc_info=True
         )
         
         raise ExternalServiceError(
@@ -380,86 +588,81 @@ def safe_external_call(func, *args, service_name: str, operation: str = None, **
 def log_performance(func):
     """Decorator to log performance metrics."""
     
-    import functools
-    import time
+    # Levels are fixed once logging is configured, so check them once here
+    debug_enabled = _level_logger.isEnabledFor(logging.DEBUG)
+    info_enabled = _level_logger.isEnabledFor(logging.INFO)
+    function_name = func.__name__
     
-    @functools.wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        function_name = func.__name__
-        
-        logger.debug(
-            "Function started",
-            function=function_name,
-            args_count=len(args),
-            kwargs_keys=list(kwargs.keys())
-        )
-        
-        try:
-            result = await func(*args, **kwargs)
-            duration = time.time() - start_time
+    # Only build the wrapper matching the decorated function
+    if asyncio.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter_ns()
             
-            logger.info(
-                "Function completed",
-                function=function_name,
-                duration=f"{duration:.3f}s"
-            )
+            if debug_enabled:
+                logger.debug(
+                    "Function started",
+                    function=function_name,
+                    args_count=len(args),
+                    kwargs_keys=list(kwargs.keys())
+                )
             
-            return result
-            
-        except Exception as e:
-            duration = time.time() - start_time
-            
-            logger.error(
-                "Function failed",
-                function=function_name,
-                duration=f"{duration:.3f}s",
-                error=str(e)
-            )
-            
-            raise
+            try:
+                result = await func(*args, **kwargs)
+                
+                if info_enabled:
+                    logger.info(
+                        "Function completed",
+                        function=function_name,
+                        duration_ms=(time.perf_counter_ns() - start) // 1_000_000
+                    )
+                
+                return result
+                
+            except Exception as e:
+                logger.error(
+                    "Function failed",
+                    function=function_name,
+                    duration_ms=(time.perf_counter_ns() - start) // 1_000_000,
+                    error=str(e)
+                )
+                
+                raise
+        
+        return async_wrapper
     
     @functools.wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
-        function_name = func.__name__
+        start = time.perf_counter_ns()
         
-        logger.debug(
-            "Function started",
-            function=function_name,
-            args_count=len(args),
-            kwargs_keys=list(kwargs.keys())
-        )
+        if debug_enabled:
+            logger.debug(
+                "Function started",
+                function=function_name,
+                args_count=len(args),
+                kwargs_keys=list(kwargs.keys())
+            )
         
         try:
             result = func(*args, **kwargs)
-            duration = time.time() - start_time
             
-            logger.info(
-                "Function completed",
-                function=function_name,
-                duration=f"{duration:.3f}s"
-            )
+            if info_enabled:
+                logger.info(
+                    "Function completed",
+                    function=function_name,
+                    duration_ms=(time.perf_counter_ns() - start) // 1_000_000
+                )
             
             return result
             
         except Exception as e:
-            duration = time.time() - start_time
-            
             logger.error(
                 "Function failed",
                 function=function_name,
-                duration=f"{duration:.3f}s",
+                duration_ms=(time.perf_counter_ns() - start) // 1_000_000,
                 error=str(e)
             )
             
             raise
     
-    if hasattr(func, '__call__'):
-        import asyncio
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
-        else:
-            return sync_wrapper
-    
-    return func
\ No newline at end of file
+    return sync_wrapper
\ No newline at end of file
@@ -6,20 +6,46 @@ It discovers, indexes, and analyzes 50+ local repositories to provide context fo
 """
 
 import os
+import sys
 import json
+import mmap
+from array import array
+from collections import OrderedDict
 import asyncio
 import logging
-from typing import List, Dict, Optional, Set, Any
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Optional, Set, Any, Tuple, Callable, NamedTuple, Iterator, Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timedelta
 import hashlib
+import pickle
 import re
+import configparser
+import threading
+import shutil
+from functools import lru_cache
 import subprocess
+from stat import S_ISREG
 from concurrent.futures import ThreadPoolExecutor, as_completed
+import xml.etree.ElementTree as ET
+
+try:
+    # lxml's C parser streams large POMs faster than ElementTree
+    from lxml import etree as lxml_etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Clark-notation names in the Maven POM namespace
+_POM_NS = '{http://maven.apache.org/POM/4.0.0}'
+_POM_DEPENDENCY = f'{_POM_NS}dependency'
+_POM_GROUP_ID = f'{_POM_NS}groupId'
+_POM_ARTIFACT_ID = f'{_POM_NS}artifactId'
+_POM_VERSION = f'{_POM_NS}version'
+_POM_SCOPE = f'{_POM_NS}scope'
+
 
 @dataclass
 class FileInfo:
@@ -32,6 +58,52 @@ class FileInfo:
     is_test: bool
 
 
+class FileIndex(NamedTuple):
+    """Column-oriented listing of a repository's files, one entry per index."""
+    paths: List[str]
+    sizes: array  # array('q')
+    languages: List[Optional[str]]
+    is_config: List[bool]
+    is_test: List[bool]
+    
+    @classmethod
+    def from_file_infos(cls, file_infos: List[FileInfo]) -> 'FileIndex':
+        """Build the columns from scanned FileInfo entries."""
+        return cls(
+            paths=[f.path for f in file_infos],
+            sizes=array('q', [f.size for f in file_infos]),
+            languages=[f.language for f in file_infos],
+            is_config=[f.is_config for f in file_infos],
+            is_test=[f.is_test for f in file_infos]
+        )
+    
+    def to_tree(self) -> Dict[str, Any]:
+        """Build a hierarchical file structure."""
+        structure = {}
+        
+        for path, size, language, is_config, is_test in zip(
+            self.paths, self.sizes, self.languages, self.is_config, self.is_test
+        ):
+            parts = path.split(os.sep)
+            current = structure
+            
+            for part in parts[:-1]:
+                if part not in current:
+                    # Directory names repeat across the tree (src, test, main)
+                    current[sys.intern(part)] = {'type': 'directory', 'children': {}}
+                current = current[part]['children']
+            
+            current[parts[-1]] = {
+                'type': 'file',
+                'size': size,
+                'language': language,
+                'is_config': is_config,
+                'is_test': is_test
+            }
+        
+        return structure
+
+
 @dataclass
 class DependencyInfo:
     """Information about project dependencies."""
@@ -51,7 +123,7 @@ class GitInfo:
     is_dirty: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class RepositoryInfo:
     """Complete information about a repository."""
     name: str
@@ -60,12 +132,167 @@ class RepositoryInfo:
     languages: List[str]
     frameworks: List[str]
     dependencies: List[DependencyInfo]
-    file_structure: Dict[str, Any]
+    files: FileIndex
     git_info: Optional[GitInfo]
     size_bytes: int
     file_count: int
     last_scanned: datetime
     scan_duration: float
+    
+    @property
+    def file_structure(self) -> Dict[str, Any]:
+        """Nested directory/file dict, built on demand from the file index."""
+        return self.files.to_tree()
+
+
+class ConfigFileCache:
+    """Config file contents read once and shared between analyzers, keyed by path, mtime and size."""
+    
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], Tuple[int, int, Any]] = {}
+    
+    def _get(self, kind: str, path: str, loader: Callable[[str], Any]) -> Any:
+        """Return the cached value for path, reloading it if the file changed."""
+        stat = os.stat(path)
+        key = (kind, path)
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+        
+        value = loader(path)
+        self._entries[key] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
+    
+    def read_text(self, path: str) -> str:
+        """File contents decoded as UTF-8, ignoring undecodable bytes."""
+        return self._get('text', path, self._load_text)
+    
+    def load_json(self, path: str) -> Any:
+        """Parsed JSON document; parse errors propagate and are not cached."""
+        return self._get('json', path, lambda p: json.loads(self.read_text(p)))
+    
+    @staticmethod
+    def _load_text(path: str) -> str:
+        with _FD_SLOTS, open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            return f.read()
+
+
+# Markers looked for in pom.xml, checked against a streamed byte window
+_MAVEN_POM_MARKERS = (
+    (b'spring-boot-starter', 'spring-boot'),
+    (b'org.springframework', 'spring'),
+    (b'hibernate', 'hibernate'),
+    (b'junit', 'junit'),
+)
+_MAVEN_POM_OVERLAP = max(len(marker) for marker, _ in _MAVEN_POM_MARKERS) - 1
+
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Substrings marking config and test files, matched in one regex pass
+# against the lower-cased file name or path
+_CONFIG_NAME_RE = re.compile('|'.join(map(re.escape, [
+    'config', '.properties', '.yml', '.yaml', '.json', '.xml',
+    '.env', 'dockerfile', 'docker-compose', '.gitignore', 'readme'
+])))
+# 'tests' and '__tests__' are covered by 'test'
+_TEST_PATH_RE = re.compile('test|spec')
+
+# Code search covers these source files and skips these directories
+_SOURCE_EXTENSIONS = ('.java', '.py', '.js', '.ts', '.jsx', '.tsx', '.cs', '.cpp', '.c', '.go', '.rs')
+_SEARCH_SKIP_DIRS = ('.git', 'node_modules', 'target', 'build')
+# Minified bundles carry source extensions but are one huge generated line
+_MINIFIED_SUFFIXES = ('.min.js',)
+
+def _open_file_budget() -> int:
+    """Descriptors the scanner's worker threads may hold open at once."""
+    try:
+        import resource
+        soft_limit = resource.getrlimit(resource.RLIMIT_NOFILE)[0]
+    except (ImportError, ValueError, OSError):
+        return 256
+    if soft_limit == resource.RLIM_INFINITY:
+        return 512
+    return max(16, min(512, soft_limit // 2))
+
+
+# Held around file opens on the scan and search paths, so raising the pool
+# sizes cannot exhaust the process descriptor limit
+_FD_SLOTS = threading.BoundedSemaphore(_open_file_budget())
+
+# ripgrep, when installed, does the code search natively
+_RG_PATH = shutil.which('rg')
+
+# Source files at or above this size are left out of framework sampling
+_MAX_SOURCE_SAMPLE_SIZE = 1_000_000
+
+# The Python code search maps files at least this large instead of reading them
+_SEARCH_MMAP_MIN_SIZE = 64 * 1024
+
+# get_file_content keeps recently read files, bounded by count and total characters
+_FILE_CONTENT_CACHE_ENTRIES = 256
+_FILE_CONTENT_CACHE_CHARS = 64 * 1024 * 1024
+
+# Code search skips files larger than this by default (generated code, dumps)
+_SEARCH_MAX_FILE_SIZE = 8 * 1024 * 1024
+
+
+@lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> 're.Pattern[bytes]':
+    """Compile a case-insensitive literal byte pattern for code search."""
+    return re.compile(re.escape(pattern.encode('utf-8')), re.IGNORECASE)
+
+
+def invalidate_pattern_cache() -> None:
+    """Drop all compiled code search patterns."""
+    _compile_pattern.cache_clear()
+
+
+# Code search keeps small files and their lowercased copies across searches,
+# bounded by the bytes held (both copies count)
+_LOWERED_FILE_CACHE_BYTES = 32 * 1024 * 1024
+
+# full path -> (mtime_ns, size, content, lowered), in LRU order
+_lowered_files: 'OrderedDict[str, Tuple[int, int, bytes, bytes]]' = OrderedDict()
+_lowered_files_bytes = 0
+_lowered_files_lock = threading.Lock()
+
+
+def _load_file_lower(path: str, mtime_ns: int, size: int) -> Tuple[bytes, bytes]:
+    """Read a small file and its ASCII-lowercased copy, reusing them until the file changes."""
+    global _lowered_files_bytes
+    with _lowered_files_lock:
+        entry = _lowered_files.get(path)
+        if entry is not None and entry[0] == mtime_ns and entry[1] == size:
+            _lowered_files.move_to_end(path)
+            return entry[2], entry[3]
+    
+    with _FD_SLOTS, open(path, 'rb') as f:
+        content = f.read()
+    lowered = content.lower()
+    
+    # Keyed by path alone, so a new version of a file replaces the old one
+    with _lowered_files_lock:
+        previous = _lowered_files.pop(path, None)
+        if previous is not None:
+            _lowered_files_bytes -= len(previous[2]) * 2
+        _lowered_files[path] = (mtime_ns, size, content, lowered)
+        _lowered_files_bytes += len(content) * 2
+        
+        while _lowered_files_bytes > _LOWERED_FILE_CACHE_BYTES:
+            _, (_, _, evicted, _) = _lowered_files.popitem(last=False)
+            _lowered_files_bytes -= len(evicted) * 2
+    
+    return content, lowered
+
+# Paths from git ls-files are stat'ed on the pool in batches of this size
+_STAT_BATCH_SIZE = 256
+
+# Bumped whenever the pickled RepositoryInfo layout changes
+_CACHE_FORMAT = 3
+
+# A requirements.txt line: name, optional [extras], optional operator and
+# version, stopping at whitespace or an environment marker (";")
+_PIP_RE = re.compile(r'^([A-Za-z0-9._-]+)(?:\[[^\]]*\])?\s*(?:(===|[<>=!~]=?)\s*([^;,\s]+))?')
 
 
 class LanguageDetector:
@@ -126,35 +353,75 @@ class LanguageDetector:
         'mybatis': ['@Mapper', 'mybatis.'],
     }
     
+    def __init__(self, config_cache: Optional[ConfigFileCache] = None):
+        self.config_cache = config_cache or ConfigFileCache()
+        
+        # Invert LANGUAGE_EXTENSIONS for O(1) lookups; the first language
+        # listing an extension wins, so .ts/.tsx stay 'javascript'
+        self._name_to_lang: Dict[str, str] = {}
+        self._ext_to_lang: Dict[str, str] = {}
+        for lang, exts in self.LANGUAGE_EXTENSIONS.items():
+            for ext in exts:
+                if ext.startswith('.'):
+                    self._ext_to_lang.setdefault(ext.lower(), lang)
+                else:
+                    self._name_to_lang.setdefault(ext, lang)
+        
+        # One alternation over every indicator, so a source file is scanned in
+        # a single regex pass; patterns shared by frameworks map to all of them
+        self._indicator_frameworks: Dict[bytes, Set[str]] = {}
+        for framework, patterns in self.FRAMEWORK_INDICATORS.items():
+            for pattern in patterns:
+                self._indicator_frameworks.setdefault(pattern.encode(), set()).add(framework)
+        self._framework_re = re.compile(b'|'.join(
+            re.escape(pattern) for pattern in sorted(self._indicator_frameworks, key=len, reverse=True)
+        ))
+    
     def detect_language(self, file_path: str) -> Optional[str]:
         """Detect the programming language of a file."""
-        file_name = os.path.basename(file_path)
-        _, ext = os.path.splitext(file_path)
+        # Plain string slicing; this runs once per scanned file
+        name = file_path[max(file_path.rfind('/'), file_path.rfind(os.sep)) + 1:]
         
         # Check exact filename matches first (like Dockerfile)
-        for lang, exts in self.LANGUAGE_EXTENSIONS.items():
-            if file_name in exts or ext.lower() in exts:
-                return lang
+        lang = self._name_to_lang.get(name)
+        if lang:
+            return lang
         
-        return None
+        # A leading dot (.bashrc) is part of the name, not an extension
+        dot = name.rfind('.')
+        return self._ext_to_lang.get(name[dot:].lower()) if dot > 0 else None
     
     def detect_frameworks(self, repo_path: str, file_infos: List[FileInfo]) -> List[str]:
         """Detect frameworks used in the repository."""
         frameworks = set()
         
+        # FileInfo paths are relative to the repository
         # Check dependency files
         for file_info in file_infos:
             file_name = os.path.basename(file_info.path)
             if file_name in self.CONFIG_FILES:
-                frameworks.update(self._analyze_config_file(file_info.path))
+                frameworks.update(self._analyze_config_file(os.path.join(repo_path, file_info.path)))
         
-        # Check source code for framework indicators
-        source_files = [f for f in file_infos if f.language in ['java', 'javascript', 'typescript', 'python']]
-        for file_info in source_files[:20]:  # Sample first 20 files for performance
+        # Check source code for framework indicators; oversized files are
+        # generated or vendored, not worth a sample slot
+        source_files = [
+            f for f in file_infos
+            if f.language in ['java', 'javascript', 'typescript', 'python'] and f.size < _MAX_SOURCE_SAMPLE_SIZE
+        ]
+        sampled = 0
+        for file_info in source_files:
+            if sampled >= 20:  # Sample first 20 text files for performance
+                break
             try:
-                frameworks.update(self._analyze_source_file(file_info.path))
+                found = self._analyze_source_file(os.path.join(repo_path, file_info.path))
             except Exception as e:
                 logger.warning(f"Error analyzing {file_info.path}: {e}")
+                continue
+            
+            # Binary files don't use up the sample
+            if found is not None:
+                frameworks.update(found)
+                sampled += 1
         
         return list(frameworks)
     
@@ -164,39 +431,46 @@ class LanguageDetector:
         file_name = os.path.basename(file_path)
         
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
-                
-                if file_name == 'pom.xml':
-                    frameworks.update(self._analyze_maven_pom(content))
-                elif file_name in ['package.json']:
-                    frameworks.update(self._analyze_package_json(content))
-                elif file_name == 'requirements.txt':
-                    frameworks.update(self._analyze_requirements_txt(content))
+            if file_name == 'pom.xml':
+                with _FD_SLOTS, open(file_path, 'rb') as f:
+                    frameworks.update(self._analyze_maven_pom(f))
+                return frameworks
+            
+            # Shared with DependencyAnalyzer, which parses the same files
+            if file_name in ['package.json']:
+                frameworks.update(self._analyze_package_json(file_path))
+            elif file_name == 'requirements.txt':
+                frameworks.update(self._analyze_requirements_txt(self.config_cache.read_text(file_path)))
                     
         except Exception as e:
             logger.warning(f"Error reading config file {file_path}: {e}")
         
         return frameworks
     
-    def _analyze_maven_pom(self, content: str) -> Set[str]:
+    def _analyze_maven_pom(self, f) -> Set[str]:
         """Analyze Maven POM file for Spring and other frameworks."""
         frameworks = set()
-        if 'spring-boot-starter' in content:
-            frameworks.add('spring-boot')
-        if 'org.springframework' in content:
-            frameworks.add('spring')
-        if 'hibernate' in content:
-            frameworks.add('hibernate')
-        if 'junit' in content:
-            frameworks.add('junit')
+        
+        # Stream the file, carrying over enough bytes that a marker split across
+        # two chunks is still seen, and stop once every marker has matched
+        carry = b''
+        for chunk in iter(lambda: f.read(_READ_CHUNK_SIZE), b''):
+            window = carry + chunk
+            for marker, framework in _MAVEN_POM_MARKERS:
+                if marker in window:
+                    frameworks.add(framework)
+            
+            if len(frameworks) == len(_MAVEN_POM_MARKERS):
+                break
+            carry = window[-_MAVEN_POM_OVERLAP:]
+        
         return frameworks
     
-    def _analyze_package_json(self, content: str) -> Set[str]:
+    def _analyze_package_json(self, file_path: str) -> Set[str]:
         """Analyze package.json for JavaScript frameworks."""
         frameworks = set()
         try:
-            data = json.loads(content)
+            data = self.config_cache.load_json(file_path)
             dependencies = {**data.get('dependencies', {}), **data.get('devDependencies', {})}
             
             for dep in dependencies:
@@ -230,16 +504,25 @@ class LanguageDetector:
                 frameworks.add('sqlalchemy')
         return frameworks
     
-    def _analyze_source_file(self, file_path: str) -> Set[str]:
-        """Analyze source code files for framework patterns."""
+    def _analyze_source_file(self, file_path: str) -> Optional[Set[str]]:
+        """Analyze source code files for framework patterns; None if the file is binary."""
         frameworks = set()
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                content = f.read()
+            with _FD_SLOTS, open(file_path, 'rb') as f:
+                # mmap rejects empty files
+                if os.fstat(f.fileno()).st_size == 0:
+                    return frameworks
                 
-                for framework, patterns in self.FRAMEWORK_INDICATORS.items():
-                    if any(pattern in content for pattern in patterns):
-                        frameworks.add(framework)
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # A NUL byte near the start means this isn't text
+                    if content.find(b'\0', 0, 512) != -1:
+                        return None
+                    
+                    for match in self._framework_re.finditer(content):
+                        frameworks.update(self._indicator_frameworks[match.group()])
+                        # Nothing left to find in the rest of the file
+                        if len(frameworks) == len(self.FRAMEWORK_INDICATORS):
+                            break
                         
         except Exception as e:
             logger.warning(f"Error reading source file {file_path}: {e}")
@@ -250,6 +533,9 @@ class LanguageDetector:
 class DependencyAnalyzer:
     """Analyzes project dependencies from various build files."""
     
+    def __init__(self, config_cache: Optional[ConfigFileCache] = None):
+        self.config_cache = config_cache or ConfigFileCache()
+    
     def analyze_dependencies(self, repo_path: str) -> List[DependencyInfo]:
         """Analyze all dependencies in the repository."""
         dependencies = []
@@ -275,27 +561,34 @@ class DependencyAnalyzer:
         """Parse Maven POM file for dependencies."""
         dependencies = []
         try:
-            import xml.etree.ElementTree as ET
-            tree = ET.parse(pom_path)
-            root = tree.getroot()
-            
-            # Handle Maven namespace
-            namespace = {'m': 'http://maven.apache.org/POM/4.0.0'}
-            
-            for dep in root.findall('.//m:dependency', namespace):
-                group_id = dep.find('m:groupId', namespace)
-                artifact_id = dep.find('m:artifactId', namespace)
-                version = dep.find('m:version', namespace)
-                scope = dep.find('m:scope', namespace)
+            with _FD_SLOTS, open(pom_path, 'rb') as pom_file:
+                # Stream <dependency> elements instead of building the whole tree
+                if LXML_AVAILABLE:
+                    events = lxml_etree.iterparse(pom_file, tag=_POM_DEPENDENCY)
+                else:
+                    events = (item for item in ET.iterparse(pom_file) if item[1].tag == _POM_DEPENDENCY)
                 
-                if group_id is not None and artifact_id is not None:
-                    dep_info = DependencyInfo(
-                        name=f"{group_id.text}:{artifact_id.text}",
-                        version=version.text if version is not None else None,
-                        scope=scope.text if scope is not None else 'compile',
-                        type='maven'
-                    )
-                    dependencies.append(dep_info)
+                for _, dep in events:
+                    group_id = dep.find(_POM_GROUP_ID)
+                    artifact_id = dep.find(_POM_ARTIFACT_ID)
+                    version = dep.find(_POM_VERSION)
+                    scope = dep.find(_POM_SCOPE)
+                    
+                    if group_id is not None and artifact_id is not None:
+                        dep_info = DependencyInfo(
+                            name=f"{group_id.text}:{artifact_id.text}",
+                            version=version.text if version is not None else None,
+                            scope=scope.text if scope is not None else 'compile',
+                            type='maven'
+                        )
+                        dependencies.append(dep_info)
+                    
+                    # Drop the parsed element (and, with lxml, its finished
+                    # siblings) so memory stays bounded on large POMs
+                    dep.clear()
+                    if LXML_AVAILABLE:
+                        while dep.getprevious() is not None:
+                            del dep.getparent()[0]
                     
         except Exception as e:
             logger.warning(f"Error parsing Maven POM {pom_path}: {e}")
@@ -306,27 +599,26 @@ class DependencyAnalyzer:
         """Parse package.json for NPM dependencies."""
         dependencies = []
         try:
-            with open(package_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                
-                # Regular dependencies
-                for name, version in data.get('dependencies', {}).items():
-                    dependencies.append(DependencyInfo(
-                        name=name,
-                        version=version,
-                        scope='runtime',
-                        type='npm'
-                    ))
+            data = self.config_cache.load_json(package_path)
+            
+            # Regular dependencies
+            for name, version in data.get('dependencies', {}).items():
+                dependencies.append(DependencyInfo(
+                    name=name,
+                    version=version,
+                    scope='runtime',
+                    type='npm'
+                ))
+            
+            # Dev dependencies
+            for name, version in data.get('devDependencies', {}).items():
+                dependencies.append(DependencyInfo(
+                    name=name,
+                    version=version,
+                    scope='development',
+                    type='npm'
+                ))
                 
-                # Dev dependencies
-                for name, version in data.get('devDependencies', {}).items():
-                    dependencies.append(DependencyInfo(
-                        name=name,
-                        version=version,
-                        scope='development',
-                        type='npm'
-                    ))
-                    
         except Exception as e:
             logger.warning(f"Error parsing package.json {package_path}: {e}")
         
@@ -336,22 +628,22 @@ class DependencyAnalyzer:
         """Parse requirements.txt for Python dependencies."""
         dependencies = []
         try:
-            with open(requirements_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('#'):
-                        # Parse package==version or package>=version
-                        match = re.match(r'^([a-zA-Z0-9\-_.]+)([><=!]+)?([\d.]+.*)?', line)
-                        if match:
-                            name = match.group(1)
-                            version = match.group(3) if match.group(3) else None
-                            dependencies.append(DependencyInfo(
-                                name=name,
-                                version=version,
-                                scope='runtime',
-                                type='pip'
-                            ))
-                            
+            for line in self.config_cache.read_text(requirements_path).splitlines():
+                line = line.strip()
+                # Skip blanks, comments and pip options such as -r/-e
+                if line and not line.startswith(('#', '-')):
+                    # Parse package==version or package>=version
+                    match = _PIP_RE.match(line)
+                    if match:
+                        name = match.group(1)
+                        version = match.group(3) if match.group(3) else None
+                        dependencies.append(DependencyInfo(
+                            name=name,
+                            version=version,
+                            scope='runtime',
+                            type='pip'
+                        ))
+                        
         except Exception as e:
             logger.warning(f"Error parsing requirements.txt {requirements_path}: {e}")
         
@@ -361,30 +653,34 @@ class DependencyAnalyzer:
 class GitAnalyzer:
     """Analyzes Git repository information."""
     
-    def analyze_git_info(self, repo_path: str) -> Optional[GitInfo]:
+    def __init__(self, max_processes: int = 20):
+        # Caps concurrent git processes (and their pipes) across all repositories
+        self._process_slots = asyncio.BoundedSemaphore(max_processes)
+    
+    async def analyze_git_info(self, repo_path: str) -> Optional[GitInfo]:
         """Extract Git information from repository."""
         git_dir = os.path.join(repo_path, '.git')
         if not os.path.exists(git_dir):
             return None
         
         try:
-            # Get current branch
-            branch = self._run_git_command(['branch', '--show-current'], repo_path).strip()
+            # One status call yields the current branch (header line) and
+            # whether the working directory is dirty (any further lines);
+            # it runs alongside the last-commit lookup
+            status, commit_info = await asyncio.gather(
+                self._run_git_command(['status', '--porcelain', '-b'], repo_path),
+                self._run_git_command(['log', '-1', '--format=%H|%ci'], repo_path)
+            )
+            status_lines = status.splitlines()
+            branch = self._parse_status_branch(status_lines[0] if status_lines else '')
+            is_dirty = any(line.strip() for line in status_lines[1:])
             
             # Get last commit info
-            commit_info = self._run_git_command(['log', '-1', '--format=%H|%ci'], repo_path).strip()
-            commit_hash, commit_date_str = commit_info.split('|', 1)
+            commit_hash, commit_date_str = commit_info.strip().split('|', 1)
             commit_date = datetime.fromisoformat(commit_date_str.replace(' ', 'T'))
             
             # Get remote URL
-            try:
-                remote_url = self._run_git_command(['remote', 'get-url', 'origin'], repo_path).strip()
-            except:
-                remote_url = None
-            
-            # Check if working directory is dirty
-            status = self._run_git_command(['status', '--porcelain'], repo_path)
-            is_dirty = bool(status.strip())
+            remote_url = await self._get_remote_url(git_dir, repo_path)
             
             return GitInfo(
                 branch=branch,
@@ -398,36 +694,125 @@ class GitAnalyzer:
             logger.warning(f"Error analyzing Git info for {repo_path}: {e}")
             return None
     
-    def _run_git_command(self, args: List[str], repo_path: str) -> str:
+    @staticmethod
+    def read_head_commit(repo_path: str) -> Optional[str]:
+        """Resolve HEAD to a commit sha from the .git directory, without running git."""
+        git_dir = os.path.join(repo_path, '.git')
+        try:
+            with open(os.path.join(git_dir, 'HEAD'), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+            if not head.startswith('ref: '):
+                return head  # Detached HEAD holds the sha itself
+            
+            ref = head[5:]
+            try:
+                with open(os.path.join(git_dir, ref), 'r', encoding='utf-8') as f:
+                    return f.read().strip()
+            except FileNotFoundError:
+                pass
+            
+            # Loose ref missing; it may have been packed
+            with open(os.path.join(git_dir, 'packed-refs'), 'r', encoding='utf-8') as f:
+                for line in f:
+                    sha, _, name = line.rstrip('\n').partition(' ')
+                    if name == ref:
+                        return sha
+        except OSError:
+            # Includes worktrees and submodules, where .git is a file
+            pass
+        return None
+    
+    @staticmethod
+    def _parse_status_branch(header: str) -> str:
+        """Extract the branch name from a `git status -b` header line."""
+        if not header.startswith('## '):
+            return ''
+        
+        branch = header[3:]
+        # Detached HEAD; `git branch --show-current` prints nothing here too
+        if branch.startswith('HEAD (no branch)'):
+            return ''
+        for prefix in ('No commits yet on ', 'Initial commit on '):
+            if branch.startswith(prefix):
+                return branch[len(prefix):]
+        
+        # Strip the upstream and ahead/behind suffix: "main...origin/main [ahead 1]"
+        return branch.split('...', 1)[0].split(' ', 1)[0]
+    
+    async def _get_remote_url(self, git_dir: str, repo_path: str) -> Optional[str]:
+        """Get the origin URL, reading .git/config directly when possible."""
+        if os.path.isdir(git_dir):
+            config = configparser.ConfigParser(strict=False, interpolation=None)
+            try:
+                config.read(os.path.join(git_dir, 'config'), encoding='utf-8')
+                return config.get('remote "origin"', 'url', fallback=None)
+            except configparser.Error:
+                pass
+        
+        # Worktrees and submodules point .git elsewhere; let git resolve it
+        try:
+            return (await self._run_git_command(['remote', 'get-url', 'origin'], repo_path)).strip()
+        except Exception:
+            return None
+    
+    async def _run_git_command(self, args: List[str], repo_path: str, timeout: float = 10) -> str:
         """Run a git command in the specified repository."""
-        cmd = ['git'] + args
-        result = subprocess.run(
-            cmd,
-            cwd=repo_path,
-            capture_output=True,
-            text=True,
-            timeout=10
-        )
+        async with self._process_slots:
+            process = await asyncio.create_subprocess_exec(
+                'git', *args,
+                cwd=repo_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                raise
         
-        if result.returncode != 0:
-            raise Exception(f"Git command failed: {result.stderr}")
+        if process.returncode != 0:
+            raise Exception(f"Git command failed: {stderr.decode(errors='replace')}")
         
-        return result.stdout
+        return stdout.decode(errors='replace')
 
 
 class RepositoryScanner:
     """Main repository scanner that orchestrates all analysis components."""
     
-    def __init__(self, base_path: str, cache_dir: str = ".repo_cache"):
+    def __init__(self, base_path: str, cache_dir: str = ".repo_cache", stat_workers: Optional[int] = None):
         self.base_path = Path(base_path)
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
         
-        self.language_detector = LanguageDetector()
-        self.dependency_analyzer = DependencyAnalyzer()
+        # Both analyzers read the same build files; share their contents
+        self.config_cache = ConfigFileCache()
+        self.language_detector = LanguageDetector(self.config_cache)
+        self.dependency_analyzer = DependencyAnalyzer(self.config_cache)
         self.git_analyzer = GitAnalyzer()
         
+        # Per-directory stat batches run here so many stat calls are in flight
+        # at once; this pays off on network and cloud block storage
+        self.stat_workers = stat_workers or min(32, (os.cpu_count() or 1) * 4)
+        self._stat_pool = ThreadPoolExecutor(max_workers=self.stat_workers, thread_name_prefix="repostat")
+        
+        # Shared by all repository analyses; kept apart from the stat pool
+        # because analysis jobs block on stat batches
+        self.analysis_workers = min(32, (os.cpu_count() or 1) * 4)
+        self._pool = ThreadPoolExecutor(max_workers=self.analysis_workers, thread_name_prefix="reposcan")
+        
         self._cache = {}
+        # Name lookups into _cache; kept in step by _cache_repository
+        self._repos_by_name: Dict[str, RepositoryInfo] = {}
+        # Recently read files for get_file_content in LRU order:
+        # full path -> (mtime_ns, size, text)
+        self._file_cache: 'OrderedDict[str, Tuple[int, int, str]]' = OrderedDict()
+        self._file_cache_chars = 0
+        self._file_cache_lock = threading.Lock()
+        # (HEAD sha, repository directory mtime, git index mtime) recorded
+        # when each entry was scanned
+        self._fingerprints: Dict[str, Tuple[str, int, int]] = {}
+        self._dirty: Set[str] = set()
         self._load_cache()
     
     async def scan_repositories(self, force_rescan: bool = False) -> List[RepositoryInfo]:
@@ -436,7 +821,9 @@ class RepositoryScanner:
         start_time = datetime.now()
         
         # Discover repository directories
-        repo_paths = self._discover_repositories()
+        # Directory probing and cache writes are blocking filesystem calls,
+        # which can stall the event loop on network filesystems
+        repo_paths = await asyncio.to_thread(self._discover_repositories)
         logger.info(f"Found {len(repo_paths)} repositories")
         
         # Scan repositories in parallel
@@ -445,8 +832,8 @@ class RepositoryScanner:
             task = self._scan_single_repository(repo_path, force_rescan)
             tasks.append(task)
         
-        # Execute scans with limited concurrency
-        semaphore = asyncio.Semaphore(5)  # Limit to 5 concurrent scans
+        # Execute scans with concurrency bounded by the analysis pool
+        semaphore = asyncio.Semaphore(max(1, min(len(repo_paths), self.analysis_workers)))
         results = []
         
         async def scan_with_semaphore(task):
@@ -462,7 +849,7 @@ class RepositoryScanner:
                 logger.error(f"Error scanning repository: {e}")
         
         # Save cache
-        self._save_cache()
+        await asyncio.to_thread(self._save_cache)
         
         scan_duration = (datetime.now() - start_time).total_seconds()
         logger.info(f"Repository scan completed in {scan_duration:.2f} seconds")
@@ -491,11 +878,16 @@ class RepositoryScanner:
         repo_name = repo_path.name
         cache_key = str(repo_path)
         
+        fingerprint = await asyncio.to_thread(self._repository_fingerprint, repo_path)
+        
         # Check cache
         if not force_rescan and cache_key in self._cache:
             cached_info = self._cache[cache_key]
-            cache_age = datetime.now() - cached_info.last_scanned
-            if cache_age < timedelta(hours=1):  # Cache for 1 hour
+            # Edits to tracked files that git hasn't noticed leave the
+            # fingerprint unchanged, so the 1 hour TTL still bounds staleness;
+            # within it, a changed fingerprint forces an early rescan
+            fresh = datetime.now() - cached_info.last_scanned < timedelta(hours=1)
+            if fresh and (fingerprint is None or self._fingerprints.get(cache_key) == fingerprint):
                 logger.debug(f"Using cached data for {repo_name}")
                 return cached_info
         
@@ -503,20 +895,27 @@ class RepositoryScanner:
         start_time = datetime.now()
         
         try:
-            # Run analysis in thread pool for CPU-intensive work
-            loop = asyncio.get_event_loop()
-            with ThreadPoolExecutor(max_workers=1) as executor:
-                repo_info = await loop.run_in_executor(
-                    executor, 
-                    self._analyze_repository, 
-                    repo_path
-                )
+            # File analysis and dependency parsing run on worker threads while
+            # the git subprocesses are awaited on the event loop
+            loop = asyncio.get_running_loop()
+            repo_info, dependencies, git_info = await asyncio.gather(
+                loop.run_in_executor(self._pool, self._analyze_repository, repo_path),
+                loop.run_in_executor(self._pool, self.dependency_analyzer.analyze_dependencies, str(repo_path)),
+                self.git_analyzer.analyze_git_info(str(repo_path))
+            )
+            repo_info.dependencies = dependencies
+            repo_info.git_info = git_info
             
             scan_duration = (datetime.now() - start_time).total_seconds()
             repo_info.scan_duration = scan_duration
             
             # Cache the result
-            self._cache[cache_key] = repo_info
+            self._cache_repository(cache_key, repo_info)
+            if fingerprint is not None:
+                self._fingerprints[cache_key] = fingerprint
+            else:
+                self._fingerprints.pop(cache_key, None)
+            self._dirty.add(cache_key)
             
             logger.info(f"Completed scanning {repo_name} in {scan_duration:.2f}s")
             return repo_info
@@ -537,27 +936,18 @@ class RepositoryScanner:
         # Detect frameworks
         frameworks = self.language_detector.detect_frameworks(str(repo_path), file_infos)
         
-        # Analyze dependencies
-        dependencies = self.dependency_analyzer.analyze_dependencies(str(repo_path))
-        
-        # Get Git information
-        git_info = self.git_analyzer.analyze_git_info(str(repo_path))
-        
         # Calculate repository size
         total_size = sum(f.size for f in file_infos)
         
-        # Build file structure
-        file_structure = self._build_file_structure(file_infos)
-        
         return RepositoryInfo(
             name=repo_path.name,
             path=str(repo_path),
             primary_language=primary_language,
             languages=list(languages.keys()),
             frameworks=frameworks,
-            dependencies=dependencies,
-            file_structure=file_structure,
-            git_info=git_info,
+            dependencies=[],  # Filled in by caller
+            files=FileIndex.from_file_infos(file_infos),
+            git_info=None,  # Filled in by caller
             size_bytes=total_size,
             file_count=len(file_infos),
             last_scanned=datetime.now(),
@@ -566,36 +956,142 @@ class RepositoryScanner:
     
     def _scan_files(self, repo_path: Path) -> List[FileInfo]:
         """Scan all files in the repository."""
-        file_infos = []
-        
         # Skip common directories that don't contain source code
         skip_dirs = {'.git', 'node_modules', 'target', 'build', 'dist', '.vscode', '.idea', '__pycache__'}
         
-        for root, dirs, files in os.walk(repo_path):
-            # Remove skip directories from dirs to avoid walking them
-            dirs[:] = [d for d in dirs if d not in skip_dirs]
+        futures = []
+        tracked = self._list_git_files(repo_path)
+        if tracked is not None:
+            # git already knows the file list and honours .gitignore, so no
+            # directory is walked; the paths are stat'ed on the pool in batches
+            for i in range(0, len(tracked), _STAT_BATCH_SIZE):
+                batch = tracked[i:i + _STAT_BATCH_SIZE]
+                futures.append(self._stat_pool.submit(self._stat_relative_paths, repo_path, batch))
+        else:
+            # The walk stays on this thread; each directory's files are stat'ed
+            # on the pool, and results are collected in walk order
+            for root, entries in self._walk_scandir(str(repo_path), skip_dirs):
+                if entries:
+                    futures.append(self._stat_pool.submit(self._stat_directory, repo_path, root, entries))
+        
+        file_infos = []
+        for future in futures:
+            file_infos.extend(future.result())
+        
+        return file_infos
+    
+    @staticmethod
+    def _list_git_files(repo_path: Path) -> Optional[List[str]]:
+        """Tracked plus untracked-but-not-ignored files, or None when git can't list them."""
+        if not (repo_path / '.git').exists():
+            return None
+        
+        try:
+            result = subprocess.run(
+                ['git', 'ls-files', '-z', '--cached', '--others', '--exclude-standard'],
+                cwd=repo_path,
+                capture_output=True,
+                timeout=30
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.debug(f"git ls-files unavailable for {repo_path}: {e}")
+            return None
+        
+        if result.returncode != 0:
+            logger.debug(f"git ls-files failed for {repo_path}: {result.stderr.decode(errors='replace')}")
+            return None
+        
+        paths = os.fsdecode(result.stdout).split('\0')
+        if os.sep != '/':
+            paths = [path.replace('/', os.sep) for path in paths]
+        # Merge conflicts list a path once per stage; drop those repeats
+        return list(dict.fromkeys(path for path in paths if path))
+    
+    def _stat_relative_paths(self, repo_path: Path, relative_paths: List[str]) -> List[FileInfo]:
+        """Build FileInfo entries for repository-relative paths from git."""
+        file_infos = []
+        
+        for relative_path in relative_paths:
+            try:
+                stat = os.stat(os.path.join(repo_path, relative_path))
+            except (OSError, PermissionError):
+                # Deleted in the working tree, or not accessible
+                continue
             
-            for file in files:
-                file_path = os.path.join(root, file)
-                relative_path = os.path.relpath(file_path, repo_path)
+            # Submodules are listed as a single gitlink directory entry
+            if not S_ISREG(stat.st_mode):
+                continue
+            
+            file = os.path.basename(relative_path)
+            file_infos.append(FileInfo(
+                path=relative_path,
+                size=stat.st_size,
+                modified=datetime.fromtimestamp(stat.st_mtime),
+                language=self.language_detector.detect_language(file),
+                is_config=self._is_config_file(file),
+                is_test=self._is_test_file(relative_path)
+            ))
+        
+        return file_infos
+    
+    @staticmethod
+    def _walk_scandir(top: str, skip_dirs: Set[str]):
+        """Walk a tree top-down like os.walk, yielding (dir_path, file DirEntry list) per directory."""
+        stack = [top]
+        while stack:
+            root = stack.pop()
+            subdirs = []
+            files = []
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        try:
+                            is_dir = entry.is_dir()
+                        except OSError:
+                            is_dir = False
+                        
+                        if not is_dir:
+                            files.append(entry)
+                        elif entry.name not in skip_dirs and not entry.is_symlink():
+                            # Like os.walk, symlinked directories are not followed
+                            subdirs.append(entry.path)
+            except OSError:
+                continue
+            
+            yield root, files
+            
+            # Reversed so directories are visited in listing order
+            stack.extend(reversed(subdirs))
+    
+    def _stat_directory(self, repo_path: Path, root: str, entries: List[os.DirEntry]) -> List[FileInfo]:
+        """Build FileInfo entries for the files of one directory."""
+        file_infos = []
+        
+        # One relpath per directory instead of per file
+        relative_root = os.path.relpath(root, repo_path)
+        
+        for entry in entries:
+            file = entry.name
+            relative_path = file if relative_root == '.' else os.path.join(relative_root, file)
+            
+            try:
+                # Served from the scandir result where the platform provides it
+                stat = entry.stat()
+                language = self.language_detector.detect_language(file)
                 
-                try:
-                    stat = os.stat(file_path)
-                    language = self.language_detector.detect_language(file_path)
-                    
-                    file_info = FileInfo(
-                        path=relative_path,
-                        size=stat.st_size,
-                        modified=datetime.fromtimestamp(stat.st_mtime),
-                        language=language,
-                        is_config=self._is_config_file(file),
-                        is_test=self._is_test_file(relative_path)
-                    )
-                    file_infos.append(file_info)
-                    
-                except (OSError, PermissionError):
-                    # Skip files we can't access
-                    continue
+                file_info = FileInfo(
+                    path=relative_path,
+                    size=stat.st_size,
+                    modified=datetime.fromtimestamp(stat.st_mtime),
+                    language=language,
+                    is_config=self._is_config_file(file),
+                    is_test=self._is_test_file(relative_path)
+                )
+                file_infos.append(file_info)
+                
+            except (OSError, PermissionError):
+                # Skip files we can't access
+                continue
         
         return file_infos
     
@@ -611,107 +1107,94 @@ class RepositoryScanner:
     
     def _is_config_file(self, filename: str) -> bool:
         """Check if a file is a configuration file."""
-        config_patterns = [
-            'config', '.properties', '.yml', '.yaml', '.json', '.xml', 
-            '.env', 'Dockerfile', 'docker-compose', '.gitignore', 'README'
-        ]
-        filename_lower = filename.lower()
-        return any(pattern in filename_lower for pattern in config_patterns)
+        return _CONFIG_NAME_RE.search(filename.lower()) is not None
     
     def _is_test_file(self, file_path: str) -> bool:
         """Check if a file is a test file."""
-        test_indicators = ['test', 'spec', '__tests__', 'tests']
-        path_lower = file_path.lower()
-        return any(indicator in path_lower for indicator in test_indicators)
+        return _TEST_PATH_RE.search(file_path.lower()) is not None
     
-    def _build_file_structure(self, file_infos: List[FileInfo]) -> Dict[str, Any]:
-        """Build a hierarchical file structure."""
-        structure = {}
-        
-        for file_info in file_infos:
-            parts = file_info.path.split(os.sep)
-            current = structure
-            
-            for i, part in enumerate(parts):
-                if i == len(parts) - 1:  # This is a file
-                    current[part] = {
-                        'type': 'file',
-                        'size': file_info.size,
-                        'language': file_info.language,
-                        'is_config': file_info.is_config,
-                        'is_test': file_info.is_test
-                    }
-                else:  # This is a directory
-                    if part not in current:
-                        current[part] = {'type': 'directory', 'children': {}}
-                    current = current[part]['children']
-        
-        return structure
+    def _repository_fingerprint(self, repo_path: Path) -> Optional[Tuple[str, int, int]]:
+        """HEAD commit, directory mtime and git index mtime, or None when HEAD cannot be resolved."""
+        head = self.git_analyzer.read_head_commit(str(repo_path))
+        if not head:
+            return None
+        try:
+            dir_mtime = os.stat(repo_path).st_mtime_ns
+        except OSError:
+            return None
+        # git rewrites the index on add, rm, checkout and status refreshes, so
+        # it catches staged and many working-tree changes below the top level
+        try:
+            index_mtime = os.stat(os.path.join(repo_path, '.git', 'index')).st_mtime_ns
+        except OSError:
+            index_mtime = 0
+        return head, dir_mtime, index_mtime
+    
+    def _cache_file(self, key: str) -> Path:
+        """Per-repository cache file, named by a hash of the cache key."""
+        return self.cache_dir / f"{hashlib.sha1(key.encode()).hexdigest()}.pkl"
     
     def _load_cache(self):
         """Load repository cache from disk."""
-        cache_file = self.cache_dir / 'repository_cache.json'
-        if cache_file.exists():
+        # One pickle per repository holding (format version, cache_key,
+        # RepositoryInfo, fingerprint); datetimes and nested dataclasses
+        # round-trip natively
+        for cache_file in self.cache_dir.glob('*.pkl'):
             try:
-                with open(cache_file, 'r') as f:
-                    cache_data = json.load(f)
-                    
-                # Convert cache data back to RepositoryInfo objects
-                for key, data in cache_data.items():
-                    # Convert datetime strings back to datetime objects
-                    data['last_scanned'] = datetime.fromisoformat(data['last_scanned'])
-                    if data.get('git_info') and data['git_info'].get('last_commit_date'):
-                        data['git_info']['last_commit_date'] = datetime.fromisoformat(data['git_info']['last_commit_date'])
-                    
-                    # Convert back to dataclass
-                    dependencies = [DependencyInfo(**dep) for dep in data.get('dependencies', [])]
-                    git_info = GitInfo(**data['git_info']) if data.get('git_info') else None
-                    
-                    self._cache[key] = RepositoryInfo(
-                        name=data['name'],
-                        path=data['path'],
-                        primary_language=data['primary_language'],
-                        languages=data['languages'],
-                        frameworks=data['frameworks'],
-                        dependencies=dependencies,
-                        file_structure=data['file_structure'],
-                        git_info=git_info,
-                        size_bytes=data['size_bytes'],
-                        file_count=data['file_count'],
-                        last_scanned=data['last_scanned'],
-                        scan_duration=data['scan_duration']
-                    )
-                    
-                logger.info(f"Loaded cache with {len(self._cache)} repositories")
-                
+                with open(cache_file, 'rb') as f:
+                    entry = pickle.load(f)
+                if entry[0] != _CACHE_FORMAT:
+                    continue  # Written by an older layout; rescanned on next scan
+                _, key, repo_info, fingerprint = entry
+                # Each pickle carries its own copies of the language names;
+                # share one instance of each across all repositories
+                languages = repo_info.files.languages
+                languages[:] = [sys.intern(lang) if lang else None for lang in languages]
+                self._cache_repository(key, repo_info)
+                if fingerprint is not None:
+                    self._fingerprints[key] = fingerprint
             except Exception as e:
-                logger.warning(f"Error loading cache: {e}")
-                self._cache = {}
+                logger.warning(f"Error loading cache file {cache_file}: {e}")
+        
+        if self._cache:
+            logger.info(f"Loaded cache with {len(self._cache)} repositories")
+    
+    def _cache_repository(self, key: str, repo_info: RepositoryInfo):
+        """Store a repository in the cache and index it by name."""
+        self._cache[key] = repo_info
+        # Keep the first repository seen under a name, but let a rescan of
+        # the same path replace it
+        indexed = self._repos_by_name.get(repo_info.name)
+        if indexed is None or indexed.path == repo_info.path:
+            self._repos_by_name[repo_info.name] = repo_info
     
     def _save_cache(self):
         """Save repository cache to disk."""
-        cache_file = self.cache_dir / 'repository_cache.json'
-        try:
-            # Convert cache to JSON-serializable format
-            cache_data = {}
-            for key, repo_info in self._cache.items():
-                data = asdict(repo_info)
-                # Convert datetime objects to strings
-                data['last_scanned'] = data['last_scanned'].isoformat()
-                if data.get('git_info') and data['git_info'].get('last_commit_date'):
-                    data['git_info']['last_commit_date'] = data['git_info']['last_commit_date'].isoformat()
-                cache_data[key] = data
-            
-            with open(cache_file, 'w') as f:
-                json.dump(cache_data, f, indent=2)
-                
-            logger.debug(f"Saved cache with {len(cache_data)} repositories")
+        # Only repositories rescanned since the last save are rewritten
+        saved = 0
+        for key in list(self._dirty):
+            repo_info = self._cache.get(key)
+            if repo_info is None:
+                self._dirty.discard(key)
+                continue
             
-        except Exception as e:
-            logger.error(f"Error saving cache: {e}")
+            cache_file = self._cache_file(key)
+            tmp_file = cache_file.with_suffix('.tmp')
+            try:
+                with open(tmp_file, 'wb') as f:
+                    entry = (_CACHE_FORMAT, key, repo_info, self._fingerprints.get(key))
+                    pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+                self._dirty.discard(key)
+                saved += 1
+            except Exception as e:
+                logger.error(f"Error saving cache for {key}: {e}")
+        
+        logger.debug(f"Saved cache for {saved} repositories")
     
-    def search_code_patterns(self, pattern: str, repo_names: Optional[List[str]] = None) -> List[Dict[str, Any]]:
-        """Search for code patterns across repositories."""
+    def search_code_patterns(self, pattern: str, repo_names: Optional[List[str]] = None,
+                             max_bytes: int = _SEARCH_MAX_FILE_SIZE) -> List[Dict[str, Any]]:
+        """Search for code patterns across repositories, skipping files over max_bytes."""
         results = []
         
         # Filter repositories if specified
@@ -722,60 +1205,180 @@ class RepositoryScanner:
             target_repos = list(self._cache.values())
         
         for repo_info in target_repos:
-            repo_results = self._search_in_repository(pattern, repo_info)
+            repo_results = self._search_in_repository(pattern, repo_info, max_bytes)
             results.extend(repo_results)
         
         return results
     
-    def _search_in_repository(self, pattern: str, repo_info: RepositoryInfo) -> List[Dict[str, Any]]:
+    def _search_in_repository(self, pattern: str, repo_info: RepositoryInfo,
+                              max_bytes: int = _SEARCH_MAX_FILE_SIZE) -> List[Dict[str, Any]]:
         """Search for a pattern in a specific repository."""
+        # Both backends search the same files. They differ only in case
+        # folding: ripgrep folds Unicode letters (so 'é' also finds 'É'),
+        # while the Python search folds ASCII letters only. That is intended;
+        # the Python path stays on raw bytes for speed, and code identifiers
+        # are overwhelmingly ASCII.
+        if _RG_PATH:
+            results = self._search_with_ripgrep(pattern, repo_info, max_bytes)
+            if results is not None:
+                return results
+        
+        return self._search_with_python(pattern, repo_info, max_bytes)
+    
+    def _search_with_ripgrep(self, pattern: str, repo_info: RepositoryInfo,
+                             max_bytes: int = _SEARCH_MAX_FILE_SIZE) -> Optional[List[Dict[str, Any]]]:
+        """Case-insensitive literal search with ripgrep; None if rg could not run."""
+        # --hidden and --no-ignore make rg search dotfiles and ignored files
+        # like the Python walk does; skipped directories stay explicit globs
+        cmd = [_RG_PATH, '--json', '--no-messages', '--ignore-case', '--fixed-strings',
+               '--hidden', '--no-ignore', '--max-filesize', str(max_bytes)]
+        for ext in _SOURCE_EXTENSIONS:
+            cmd += ['--iglob', f'*{ext}']
+        for suffix in _MINIFIED_SUFFIXES:
+            cmd += ['--iglob', f'!*{suffix}']
+        for skip_dir in _SEARCH_SKIP_DIRS:
+            cmd += ['--glob', f'!{skip_dir}']
+        cmd += ['-e', pattern, '--', '.']
+        
+        try:
+            result = subprocess.run(cmd, cwd=repo_info.path, capture_output=True, timeout=60)
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"ripgrep failed for {repo_info.name}, falling back: {e}")
+            return None
+        
+        # Exit code 1 means no matches; 2 means errors, possibly with partial output
+        if result.returncode == 2 and not result.stdout:
+            return None
+        
         results = []
-        repo_path = Path(repo_info.path)
+        for raw in result.stdout.splitlines():
+            event = json.loads(raw)
+            if event.get('type') != 'match':
+                continue
+            
+            data = event['data']
+            path = data['path'].get('text')
+            line = data['lines'].get('text')
+            if path is None or line is None:
+                continue  # Non-UTF-8 path or line, reported base64-encoded
+            
+            results.append({
+                'repository': repo_info.name,
+                'file_path': os.path.normpath(path),
+                'line_number': data['line_number'],
+                'line_content': line.strip(),
+                'pattern': pattern
+            })
         
-        # Only search in source code files
-        source_extensions = {'.java', '.py', '.js', '.ts', '.jsx', '.tsx', '.cs', '.cpp', '.c', '.go', '.rs'}
+        return results
+    
+    def _search_with_python(self, pattern: str, repo_info: RepositoryInfo,
+                            max_bytes: int = _SEARCH_MAX_FILE_SIZE) -> List[Dict[str, Any]]:
+        """Case-insensitive literal search by reading each source file."""
+        results = []
+        repo_path = str(repo_info.path)
+        # Compiled once per distinct pattern; the scan runs over raw bytes in
+        # the regex engine, and only matching lines are decoded
+        prog = _compile_pattern(pattern)
+        # bytes.lower() folds ASCII only, the same as IGNORECASE on bytes
+        needle = pattern.encode('utf-8').lower()
         
         try:
-            for root, dirs, files in os.walk(repo_path):
-                # Skip common non-source directories
-                dirs[:] = [d for d in dirs if d not in {'.git', 'node_modules', 'target', 'build'}]
-                
-                for file in files:
-                    _, ext = os.path.splitext(file)
-                    if ext.lower() in source_extensions:
-                        file_path = os.path.join(root, file)
-                        relative_path = os.path.relpath(file_path, repo_path)
-                        
-                        try:
-                            with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-                                content = f.read()
-                                
-                            # Search for pattern (simple string search for now)
-                            lines = content.split('\n')
-                            for line_num, line in enumerate(lines, 1):
-                                if pattern.lower() in line.lower():
-                                    results.append({
-                                        'repository': repo_info.name,
-                                        'file_path': relative_path,
-                                        'line_number': line_num,
-                                        'line_content': line.strip(),
-                                        'pattern': pattern
-                                    })
-                                    
-                        except Exception as e:
-                            logger.debug(f"Error searching in {file_path}: {e}")
+            file_paths = []
+            for root, entries in self._walk_scandir(repo_path, set(_SEARCH_SKIP_DIRS)):
+                for entry in entries:
+                    name = entry.name.lower()
+                    _, ext = os.path.splitext(name)
+                    if ext in _SOURCE_EXTENSIONS and not name.endswith(_MINIFIED_SUFFIXES):
+                        file_paths.append(entry.path)
+            
+            # File reads and byte-level regex scans both release the GIL, so
+            # scanning files on the pool overlaps IO with matching
+            hits = self._pool.map(lambda file_path: self._search_file(file_path, prog, needle, max_bytes), file_paths)
+            for file_path, matches in zip(file_paths, hits):
+                if not matches:
+                    continue
+                relative_path = os.path.relpath(file_path, repo_path)
+                for line_num, line in matches:
+                    results.append({
+                        'repository': repo_info.name,
+                        'file_path': relative_path,
+                        'line_number': line_num,
+                        'line_content': line.decode('utf-8', 'ignore').strip(),
+                        'pattern': pattern
+                    })
                             
         except Exception as e:
             logger.warning(f"Error searching repository {repo_info.name}: {e}")
         
         return results
     
+    @classmethod
+    def _search_file(cls, file_path: str, prog: 're.Pattern[bytes]', needle: bytes,
+                     max_bytes: int) -> List[Tuple[int, bytes]]:
+        """Return the (line number, line bytes) pairs in a file that contain the pattern."""
+        try:
+            # Small files are cheaper to read than to map, and their
+            # lowercased copies are reused by later searches until they change
+            st = os.stat(file_path)
+            # Never open FIFOs or devices, which could block a pool thread
+            if not S_ISREG(st.st_mode) or st.st_size > max_bytes:
+                return []
+            if st.st_size < _SEARCH_MMAP_MIN_SIZE:
+                content, lowered = _load_file_lower(file_path, st.st_mtime_ns, st.st_size)
+                # A plain find over the lowercased copy is several times
+                # faster than an IGNORECASE regex and rejects most files
+                return list(cls._matching_lines(content, cls._find_all(lowered, needle)))
+            with _FD_SLOTS, open(file_path, 'rb') as f:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    return list(cls._matching_lines(content, (m.start() for m in prog.finditer(content))))
+        except Exception as e:
+            logger.debug(f"Error searching in {file_path}: {e}")
+            return []
+    
+    @staticmethod
+    def _find_all(haystack: bytes, needle: bytes) -> Iterator[int]:
+        """Yield the offset of every occurrence of needle in haystack."""
+        pos = haystack.find(needle)
+        while pos != -1:
+            yield pos
+            pos = haystack.find(needle, pos + 1)
+    
+    @staticmethod
+    def _count_newlines(content, start: int, end: int) -> int:
+        """Count newlines in content[start:end], copying at most one chunk at a time."""
+        if isinstance(content, bytes):
+            return content.count(b'\n', start, end)
+        # mmap has no count(); slice it in bounded windows
+        total = 0
+        for pos in range(start, end, _READ_CHUNK_SIZE):
+            total += content[pos:min(pos + _READ_CHUNK_SIZE, end)].count(b'\n')
+        return total
+    
+    @classmethod
+    def _matching_lines(cls, content, starts: Iterable[int]) -> Iterator[Tuple[int, bytes]]:
+        """Yield (line number, line bytes) for each line of content holding a match start."""
+        # Line numbers come from counting newlines between consecutive matches
+        line_num = 1
+        counted_to = 0
+        for start in starts:
+            # One result per line; skip further matches on a reported line
+            if start < counted_to:
+                continue
+            line_num += cls._count_newlines(content, counted_to, start)
+            line_start = content.rfind(b'\n', 0, start) + 1
+            line_end = content.find(b'\n', start)
+            if line_end == -1:
+                line_end = len(content)
+            
+            yield line_num, content[line_start:line_end]
+            
+            line_num += 1
+            counted_to = line_end + 1
+    
     def get_repository_by_name(self, name: str) -> Optional[RepositoryInfo]:
         """Get repository information by name."""
-        for repo_info in self._cache.values():
-            if repo_info.name == name:
-                return repo_info
-        return None
+        return self._repos_by_name.get(name)
     
     def get_file_content(self, repo_name: str, file_path: str) -> Optional[str]:
         """Get the content of a specific file in a repository."""
@@ -785,11 +1388,37 @@ class RepositoryScanner:
         
         full_path = os.path.join(repo_info.path, file_path)
         try:
-            with open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
-                return f.read()
+            stat = os.stat(full_path)
+            with self._file_cache_lock:
+                entry = self._file_cache.get(full_path)
+                if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+                    self._file_cache.move_to_end(full_path)
+                    return entry[2]
+            
+            with _FD_SLOTS, open(full_path, 'r', encoding='utf-8', errors='ignore') as f:
+                content = f.read()
+            self._remember_file_content(full_path, stat, content)
+            return content
         except Exception as e:
             logger.warning(f"Error reading file {full_path}: {e}")
             return None
+    
+    def _remember_file_content(self, full_path: str, stat: os.stat_result, content: str):
+        """Add a file's contents to the LRU, evicting the oldest entries past the caps."""
+        if len(content) > _FILE_CONTENT_CACHE_CHARS:
+            return
+        
+        with self._file_cache_lock:
+            previous = self._file_cache.pop(full_path, None)
+            if previous is not None:
+                self._file_cache_chars -= len(previous[2])
+            self._file_cache[full_path] = (stat.st_mtime_ns, stat.st_size, content)
+            self._file_cache_chars += len(content)
+            
+            while (len(self._file_cache) > _FILE_CONTENT_CACHE_ENTRIES
+                   or self._file_cache_chars > _FILE_CONTENT_CACHE_CHARS):
+                _, (_, _, evicted) = self._file_cache.popitem(last=False)
+                self._file_cache_chars -= len(evicted)
 
 
 # Example usage
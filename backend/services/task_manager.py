@@ -4,16 +4,57 @@ Task Manager Service - Handles reading and parsing tasks from tasks.md
 
 import os
 import re
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Any, Callable, Tuple, Set
 from dataclasses import dataclass
+from datetime import datetime, timezone
 import logging
 
+import aiofiles
+import orjson
+
 from ..middleware import ValidationError, ConfigurationError
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Dedicated threads for tasks.md I/O, so file reads never queue behind work
+# other components submit to the event loop's default executor
+FILE_IO_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="taskio")
+
+# A markdown list item "* description"; group 1 is the stripped line and
+# group 2 the description. [^\S\n] is whitespace that stays on one line.
+_TASK_LINE_RE = re.compile(r'^[^\S\n]*(\* [^\S\n]*(\S[^\n]*?))[^\S\n]*$', re.MULTILINE)
+
+# Category keywords in priority order; a task takes the first category
+# with a keyword anywhere in its description
+_CATEGORY_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), category)
+    for pattern, category in [
+        (r'github action|gha', "GitHub Actions"),
+        (r'mfe|micro-frontend|imedia-', "MFE (Micro-frontend)"),
+        (r'pipeline migration|harness deployment', "Pipeline Migration"),
+        (r'java|annotation|library', "Java/Backend"),
+        (r'graphql', "GraphQL"),
+        (r'launch darkly|launchdarkly', "Launch Darkly"),
+        (r'database|table|cppf', "Database"),
+    ]
+]
+
+# Processing task types in priority order, matched like the categories;
+# a task with none of these keywords is a feature
+_TASK_TYPE_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), task_type)
+    for pattern, task_type in [
+        (r'implement|create|add', "feature"),
+        (r'fix|^(?=.*remove)(?=.*issues)', "bug"),
+        (r'update|migrate|refactor', "technical"),
+        (r'setup|pipeline|deployment', "infrastructure"),
+    ]
+]
+
+@dataclass(slots=True)
 class Task:
     """Represents a single task from tasks.md"""
     id: int
@@ -29,28 +70,55 @@ class TaskManager:
     def __init__(self, tasks_file_path: str):
         self.tasks_file_path = Path(tasks_file_path)
         self.tasks: List[Task] = []
+        self._by_id: Dict[int, Task] = {}
+        # Processing task type per task id, filled on first use for each load
+        self._task_types: Dict[int, str] = {}
+        # mtime of tasks.md when self.tasks was parsed; loads skip unchanged files
+        self._loaded_mtime_ns: Optional[int] = None
         self._task_status_cache: Dict[int, Dict] = {}
+        # Encoded API responses keyed by name, stamped with (file mtime, state version)
+        self._cached: Dict[str, Tuple[Tuple[int, int], bytes]] = {}
+        self._state_version = 0
+        # Built once per load; the summary is kept current on status updates
+        self._categories: Dict[str, List[Task]] = {}
+        self._category_counts: Dict[str, int] = {}
+        self._summary: Dict[str, int] = {}
+        # Tasks grouped by status, regrouped lazily once the state version moves
+        self._by_status: Dict[str, List[Task]] = {}
+        self._by_status_version = -1
+        # Search index: lower-cased descriptions and trigram -> task ids postings
+        self._desc_lc: Dict[int, str] = {}
+        self._trigrams: Dict[str, Set[int]] = {}
         
     def load_tasks(self) -> List[Task]:
         """Load and parse tasks from tasks.md file"""
-        try:
-            if not self.tasks_file_path.exists():
-                raise ConfigurationError(
-                    f"Tasks file not found: {self.tasks_file_path}",
-                    config_key="tasks_file"
-                )
-            
-            logger.info(f"Loading tasks from: {self.tasks_file_path}")
+        with self._load_errors():
+            mtime_ns = self._stale_mtime_ns()
+            if mtime_ns is None:
+                return self.tasks
             
             with open(self.tasks_file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            tasks = self._parse_tasks(content)
-            self.tasks = tasks
+            return self._load_content(content, mtime_ns)
+    
+    async def aload_tasks(self) -> List[Task]:
+        """Load and parse tasks from tasks.md without blocking the event loop"""
+        with self._load_errors():
+            mtime_ns = self._stale_mtime_ns()
+            if mtime_ns is None:
+                return self.tasks
             
-            logger.info(f"Loaded {len(tasks)} tasks from tasks.md")
-            return tasks
+            async with aiofiles.open(self.tasks_file_path, 'r', encoding='utf-8', executor=FILE_IO_POOL) as f:
+                content = await f.read()
             
+            return self._load_content(content, mtime_ns)
+    
+    @contextmanager
+    def _load_errors(self):
+        """Report any failure to load tasks.md as a ConfigurationError"""
+        try:
+            yield
         except FileNotFoundError:
             raise ConfigurationError(
                 f"Tasks file not found: {self.tasks_file_path}",
@@ -63,30 +131,44 @@ class TaskManager:
                 config_key="tasks_file"
             )
     
+    def _stale_mtime_ns(self) -> Optional[int]:
+        """Stat tasks.md; returns its mtime if it needs (re)loading, else None"""
+        mtime_ns = self.tasks_file_path.stat().st_mtime_ns
+        if self.tasks and mtime_ns == self._loaded_mtime_ns:
+            return None
+        
+        logger.info(f"Loading tasks from: {self.tasks_file_path}")
+        return mtime_ns
+    
+    def _load_content(self, content: str, mtime_ns: int) -> List[Task]:
+        """Parse tasks.md content and make it the current task list"""
+        tasks = self._parse_tasks(content)
+        self.tasks = tasks
+        self._by_id = {task.id: task for task in tasks}
+        self._task_types = {}
+        self._index_tasks()
+        self._state_version += 1
+        # Stat'ed before the read, so a write racing the load forces a reread
+        self._loaded_mtime_ns = mtime_ns
+        
+        logger.info(f"Loaded {len(tasks)} tasks from tasks.md")
+        return tasks
+    
     def _parse_tasks(self, content: str) -> List[Task]:
         """Parse markdown content and extract tasks"""
         tasks = []
-        lines = content.split('\n')
-        task_id = 1
         
-        for line_num, line in enumerate(lines, 1):
-            # Look for lines that start with * (markdown list items)
-            line = line.strip()
-            if line.startswith('* '):
-                # Extract the task description (everything after the *)
-                description = line[2:].strip()
-                
-                if description:  # Only add non-empty descriptions
-                    task = Task(
-                        id=task_id,
-                        description=description,
-                        raw_line=line,
-                        status="not_started"
-                    )
-                    tasks.append(task)
-                    task_id += 1
-                    
-                    logger.debug(f"Parsed task {task_id-1}: {description[:50]}...")
+        # One regex pass finds every non-empty "* " list item
+        for task_id, match in enumerate(_TASK_LINE_RE.finditer(content), 1):
+            raw_line, description = match.groups()
+            tasks.append(Task(
+                id=task_id,
+                description=description,
+                raw_line=raw_line,
+                status="not_started"
+            ))
+            
+            logger.debug(f"Parsed task {task_id}: {description[:50]}...")
         
         return tasks
     
@@ -101,27 +183,14 @@ class TaskManager:
         if not self.tasks:
             self.load_tasks()
             
-        for task in self.tasks:
-            if task.id == task_id:
-                return task
-        return None
+        return self._by_id.get(task_id)
     
     def get_task_summary(self) -> Dict[str, int]:
         """Get summary statistics of tasks"""
         if not self.tasks:
             self.load_tasks()
             
-        summary = {
-            "total": len(self.tasks),
-            "not_started": 0,
-            "in_progress": 0,
-            "completed": 0
-        }
-        
-        for task in self.tasks:
-            summary[task.status] += 1
-            
-        return summary
+        return dict(self._summary)
     
     def update_task_status(self, task_id: int, status: str, context_id: str = None, jira_card_id: str = None):
         """Update the status of a specific task"""
@@ -142,11 +211,14 @@ class TaskManager:
             )
         
         # Update task properties
+        self._summary[task.status] -= 1
+        self._summary[status] += 1
         task.status = status
         if context_id:
             task.context_id = context_id
         if jira_card_id:
             task.jira_card_id = jira_card_id
+        self._state_version += 1
             
         # Cache the update (in a real implementation, this might be persisted to a database)
         self._task_status_cache[task_id] = {
@@ -162,8 +234,17 @@ class TaskManager:
         """Get all tasks with a specific status"""
         if not self.tasks:
             self.load_tasks()
+        
+        # Loads and status updates both bump the state version, so one
+        # grouping pass serves every status until the next change
+        if self._by_status_version != self._state_version:
+            by_status: Dict[str, List[Task]] = {}
+            for task in self.tasks:
+                by_status.setdefault(task.status, []).append(task)
+            self._by_status = by_status
+            self._by_status_version = self._state_version
             
-        return [task for task in self.tasks if task.status == status]
+        return list(self._by_status.get(status, ()))
     
     def search_tasks(self, query: str) -> List[Task]:
         """Search tasks by description content"""
@@ -171,11 +252,25 @@ class TaskManager:
             self.load_tasks()
             
         query_lower = query.lower()
-        matching_tasks = []
         
-        for task in self.tasks:
-            if query_lower in task.description.lower():
-                matching_tasks.append(task)
+        if len(query_lower) < 3:
+            # Too short to shingle; scan the pre-lowered descriptions
+            candidate_ids = self._desc_lc.keys()
+        else:
+            # Every trigram of the query must occur in a matching description
+            postings = [
+                self._trigrams.get(query_lower[i:i + 3], set())
+                for i in range(len(query_lower) - 2)
+            ]
+            postings.sort(key=len)
+            candidate_ids = set.intersection(*postings)
+        
+        # Task ids follow file order, so sorting keeps results in task order
+        matching_tasks = [
+            self._by_id[task_id]
+            for task_id in sorted(candidate_ids)
+            if query_lower in self._desc_lc[task_id]
+        ]
                 
         logger.debug(f"Found {len(matching_tasks)} tasks matching query: {query}")
         return matching_tasks
@@ -185,6 +280,17 @@ class TaskManager:
         if not self.tasks:
             self.load_tasks()
         
+        return self._categories
+    
+    def get_category_counts(self) -> Dict[str, int]:
+        """Get the number of tasks in each category"""
+        if not self.tasks:
+            self.load_tasks()
+        
+        return self._category_counts
+    
+    def _index_tasks(self):
+        """Build the category map and status summary for the loaded tasks in one pass"""
         categories = {
             "GitHub Actions": [],
             "MFE (Micro-frontend)": [],
@@ -195,50 +301,74 @@ class TaskManager:
             "Database": [],
             "Other": []
         }
+        summary = {
+            "total": len(self.tasks),
+            "not_started": 0,
+            "in_progress": 0,
+            "completed": 0
+        }
         
         for task in self.tasks:
-            desc_lower = task.description.lower()
-            categorized = False
-            
-            # Categorize based on keywords
-            if "github action" in desc_lower or "gha" in desc_lower:
-                categories["GitHub Actions"].append(task)
-                categorized = True
-            elif "mfe" in desc_lower or "micro-frontend" in desc_lower or "imedia-" in desc_lower:
-                categories["MFE (Micro-frontend)"].append(task)
-                categorized = True
-            elif "pipeline migration" in desc_lower or "harness deployment" in desc_lower:
-                categories["Pipeline Migration"].append(task)
-                categorized = True
-            elif "java" in desc_lower or "annotation" in desc_lower or "library" in desc_lower:
-                categories["Java/Backend"].append(task)
-                categorized = True
-            elif "graphql" in desc_lower or "nf-graphql" in desc_lower:
-                categories["GraphQL"].append(task)
-                categorized = True
-            elif "launch darkly" in desc_lower or "launchdarkly" in desc_lower:
-                categories["Launch Darkly"].append(task)
-                categorized = True
-            elif "database" in desc_lower or "table" in desc_lower or "cppf" in desc_lower:
-                categories["Database"].append(task)
-                categorized = True
-            
-            if not categorized:
-                categories["Other"].append(task)
+            categories[self._categorize(task)].append(task)
+            summary[task.status] += 1
+        
+        self._build_search_index()
         
         # Remove empty categories
-        return {k: v for k, v in categories.items() if v}
+        self._categories = {k: v for k, v in categories.items() if v}
+        self._category_counts = {k: len(v) for k, v in self._categories.items()}
+        self._summary = summary
+    
+    def _build_search_index(self):
+        """Index lower-cased task descriptions by their 3-character shingles"""
+        self._desc_lc = {task.id: task.description.lower() for task in self.tasks}
+        
+        trigrams: Dict[str, Set[int]] = {}
+        for task_id, desc_lc in self._desc_lc.items():
+            for i in range(len(desc_lc) - 2):
+                trigrams.setdefault(desc_lc[i:i + 3], set()).add(task_id)
+        self._trigrams = trigrams
+    
+    @staticmethod
+    def _categorize(task: Task) -> str:
+        """Pick a task's category from keywords in its description"""
+        for pattern, category in _CATEGORY_PATTERNS:
+            if pattern.search(task.description):
+                return category
+        
+        return "Other"
     
     def reload_tasks(self) -> List[Task]:
         """Reload tasks from file (useful if tasks.md is updated)"""
+        # Loading replaces every index and is skipped if tasks.md is unchanged
         logger.info("Reloading tasks from file...")
-        self.tasks.clear()
         return self.load_tasks()
     
+    async def areload_tasks(self) -> List[Task]:
+        """Reload tasks from file without blocking the event loop"""
+        logger.info("Reloading tasks from file...")
+        return await self.aload_tasks()
+    
+    def cached_json(self, key: str, builder: Callable[[], Any]) -> bytes:
+        """Get an encoded response body, rebuilt only when tasks.md or task state changes"""
+        try:
+            mtime = self.tasks_file_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        
+        # Status updates change responses without touching the file
+        stamp = (mtime, self._state_version)
+        cached = self._cached.get(key)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        body = orjson.dumps(builder())
+        self._cached[key] = (stamp, body)
+        return body
+    
     def _get_timestamp(self) -> str:
         """Get current timestamp as string"""
-        from datetime import datetime
-        return datetime.utcnow().isoformat()
+        return datetime.now(timezone.utc).isoformat()
     
     def validate_task_selection(self, task_id: int) -> Task:
         """Validate that a task can be selected and processed"""
@@ -271,19 +401,14 @@ class TaskManager:
         """Get task details formatted for the agent processing pipeline"""
         task = self.validate_task_selection(task_id)
         
-        # Determine task type based on content
-        desc_lower = task.description.lower()
-        
-        if "implement" in desc_lower or "create" in desc_lower or "add" in desc_lower:
-            task_type = "feature"
-        elif "fix" in desc_lower or "remove" in desc_lower and "issues" in desc_lower:
-            task_type = "bug"
-        elif "update" in desc_lower or "migrate" in desc_lower or "refactor" in desc_lower:
-            task_type = "technical"
-        elif "setup" in desc_lower or "pipeline" in desc_lower or "deployment" in desc_lower:
-            task_type = "infrastructure"
-        else:
-            task_type = "feature"  # default
+        # Determine task type based on content; descriptions only change on reload
+        task_type = self._task_types.get(task.id)
+        if task_type is None:
+            task_type = next(
+                (task_type for pattern, task_type in _TASK_TYPE_PATTERNS if pattern.search(task.description)),
+                "feature"
+            )
+            self._task_types[task.id] = task_type
         
         return {
             "task_id": f"TASK-{task.id:03d}",  # Format as TASK-001, TASK-002, etc.
@@ -0,0 +1,10 @@
+"""
+Utilities package for the Multi-Agent Jira Card Creator application.
+"""
+
+from .cache import TTLCache, single_flight
+
+__all__ = [
+    "TTLCache",
+    "single_flight"
+]
@@ -0,0 +1,72 @@
+"""
+Caching Utilities Module
+
+This module provides the bounded TTL cache and single-flight helper shared by
+the database connector and the context manager.
+"""
+
+import time
+import logging
+import asyncio
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from datetime import timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int, ttl: timedelta, name: str = "cache"):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl.total_seconds()
+        self.name = name
+        self.evictions = 0
+        self._entries: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+    
+    def get(self, key: Any) -> Optional[Any]:
+        """Get a live entry, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        value, stored_at = entry
+        if time.monotonic() - stored_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return value
+    
+    def set(self, key: Any, value: Any) -> None:
+        """Store an entry, evicting the least recently used ones past maxsize."""
+        self._entries[key] = (value, time.monotonic())
+        self._entries.move_to_end(key)
+        
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+            logger.debug(f"Evicted entry from {self.name} ({self.evictions} evictions total)")
+    
+    def discard_where(self, predicate) -> int:
+        """Drop every entry whose key matches the predicate; returns the count dropped."""
+        stale = [key for key in self._entries if predicate(key)]
+        for key in stale:
+            del self._entries[key]
+        return len(stale)
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+async def single_flight(inflight: Dict[Any, "asyncio.Task"], key: Any, factory):
+    """Share one in-progress computation among concurrent callers of the same key."""
+    task = inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        inflight[key] = task
+        task.add_done_callback(lambda _: inflight.pop(key, None))
+    
+    # Shielded so one caller's cancellation doesn't cancel the shared work
+    return await asyncio.shield(task)
@@ -7,6 +7,15 @@ export interface Task {
   raw_line?: string;
 }
 
+// Column-oriented task list as returned by GET /api/tasks
+export interface TaskColumns {
+  ids: number[];
+  descriptions: string[];
+  statuses: Task['status'][];
+  context_ids: (string | null)[];
+  jira_card_ids: (string | null)[];
+}
+
 export interface TaskSummary {
   total: number;
   not_started: number;
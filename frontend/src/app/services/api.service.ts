@@ -1,7 +1,8 @@
 import { Injectable } from '@angular/core';
 import { HttpClient } from '@angular/common/http';
 import { Observable, BehaviorSubject } from 'rxjs';
-import { Task, TaskSummary, TaskCategory, TaskSearchResult, ProcessTaskResponse } from '../models/task.model';
+import { map } from 'rxjs/operators';
+import { Task, TaskColumns, TaskSummary, TaskCategory, TaskSearchResult, ProcessTaskResponse } from '../models/task.model';
 
 export interface Repository {
   name: string;
@@ -75,7 +76,19 @@ export class ApiService {
 
   // Task Management (New - from tasks.md)
   getAllTasks(): Observable<{ status: string; tasks: Task[]; summary: TaskSummary; categories: any; total_tasks: number }> {
-    return this.http.get<{ status: string; tasks: Task[]; summary: TaskSummary; categories: any; total_tasks: number }>(`${this.baseUrl}/tasks`);
+    return this.http.get<{ status: string; columns: TaskColumns; summary: TaskSummary; categories: any; total_tasks: number }>(`${this.baseUrl}/tasks`).pipe(
+      map(({ columns, ...rest }) => ({
+        ...rest,
+        // Rebuild task records from the column-oriented payload
+        tasks: columns.ids.map((id, i) => ({
+          id,
+          description: columns.descriptions[i],
+          status: columns.statuses[i],
+          context_id: columns.context_ids[i] ?? undefined,
+          jira_card_id: columns.jira_card_ids[i] ?? undefined
+        }))
+      }))
+    );
   }
 
   getTaskCategories(): Observable<{ status: string; categories: TaskCategory }> {
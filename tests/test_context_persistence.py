@@ -0,0 +1,104 @@
+"""
+Round-trip tests for persisted workflow contexts
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+from backend.context.manager import (
+    ContextManager,
+    RepositoryContext,
+    TaskContext,
+    WorkflowContext,
+    _from_epoch_us,
+    _to_epoch_us,
+)
+from backend.repository.scanner import FileInfo, FileIndex, GitInfo, RepositoryInfo
+
+# git reports commit dates with the committer's offset (%ci)
+COMMIT_DATE = datetime(2024, 5, 1, 12, 30, 5, 250, tzinfo=timezone(timedelta(hours=-7)))
+
+
+def _repository_info() -> RepositoryInfo:
+    files = FileIndex.from_file_infos([
+        FileInfo(path="src/app.py", size=120, modified=datetime.now(), language="python",
+                 is_config=False, is_test=False),
+        FileInfo(path="tests/test_app.py", size=80, modified=datetime.now(), language="python",
+                 is_config=False, is_test=True),
+    ])
+    return RepositoryInfo(
+        name="demo",
+        path="/repos/demo",
+        primary_language="python",
+        languages=["python"],
+        frameworks=[],
+        dependencies=[],
+        files=files,
+        git_info=GitInfo(
+            branch="main",
+            last_commit="0123abcd",
+            last_commit_date=COMMIT_DATE,
+            remote_url=None,
+            is_dirty=False
+        ),
+        size_bytes=200,
+        file_count=2,
+        last_scanned=datetime.now(),
+        scan_duration=0.1
+    )
+
+
+def test_repository_context_round_trip(tmp_path):
+    manager = ContextManager(repository_scanner=None, cache_dir=str(tmp_path))
+    repo = _repository_info()
+    now = datetime.now()
+    context = WorkflowContext(
+        task_context=TaskContext(
+            task_id="TASK-001",
+            task_description="Add a health check endpoint",
+            task_type="feature",
+            technologies=["python"],
+            keywords=["health"],
+            created_at=now,
+            workflow_step="questions"
+        ),
+        repository_context=RepositoryContext(
+            selected_repositories=["demo"],
+            repository_info={"demo": repo},
+            relevance_scores={"demo": 0.9},
+            last_updated=now,
+            task_keywords=["health"]
+        ),
+        database_context=None,
+        context_id="ctx_roundtrip",
+        created_at=now,
+        last_accessed=now
+    )
+    manager._active_contexts[context.context_id] = context
+
+    asyncio.run(manager._persist_context(context.context_id))
+    assert (tmp_path / "ctx_roundtrip.json").exists()
+
+    manager._active_contexts.clear()
+    loaded = asyncio.run(manager._load_context(context.context_id))
+
+    assert loaded is not None
+    repo_data = loaded.repository_context.repository_info["demo"]
+    assert "files" not in repo_data
+    assert repo_data["file_structure"] == repo.file_structure
+    assert loaded.repository_context.relevance_scores == {"demo": 0.9}
+    assert repo_data["git_info"]["last_commit_date"] == COMMIT_DATE
+    assert repo_data["git_info"]["last_commit_date"].utcoffset() == COMMIT_DATE.utcoffset()
+    assert loaded.created_at == now
+    assert loaded.created_at.tzinfo is None
+
+
+def test_epoch_round_trip_keeps_naive_and_aware_datetimes():
+    naive = datetime(2024, 5, 1, 12, 30, 5, 123456)
+    aware = datetime(2024, 5, 1, 12, 30, 5, 7, tzinfo=timezone(timedelta(hours=5, minutes=30)))
+
+    restored_naive = _from_epoch_us(_to_epoch_us(naive))
+    restored_aware = _from_epoch_us(_to_epoch_us(aware))
+
+    assert restored_naive == naive and restored_naive.tzinfo is None
+    assert restored_aware == aware and restored_aware.utcoffset() == aware.utcoffset()